@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from evolution_suite.api.schemas import (
     AgentOutputResponse,
@@ -14,6 +15,7 @@ from evolution_suite.api.schemas import (
     AgentResponse,
     BulkActionRequest,
     BulkGuidanceRequest,
+    BulkSpawnRequest,
     CycleListResponse,
     CycleResponse,
     DailyUsageResponse,
@@ -33,6 +35,7 @@ from evolution_suite.api.schemas import (
     UsageMetricsResponse,
 )
 from evolution_suite.core.agent import AgentType
+from evolution_suite.core.agent_manager import DuplicateAgentError
 
 if TYPE_CHECKING:
     from evolution_suite.core.config import Config
@@ -41,6 +44,33 @@ if TYPE_CHECKING:
     from evolution_suite.comms.websocket import WebSocketManager
 
 
+# Free-text fields that ?truncate= shortens; ids, statuses and timestamps are left whole
+_TRUNCATED_FIELDS = frozenset({"goal", "currentTask", "error", "content"})
+
+
+def _trim(
+    record: dict[str, Any],
+    fields: set[str] | None,
+    truncate: int | None,
+) -> dict[str, Any]:
+    """Keep only ``fields`` of a record and cut its free text to ``truncate`` chars."""
+    if fields is not None:
+        record = {key: value for key, value in record.items() if key in fields}
+    if truncate is not None:
+        for key in _TRUNCATED_FIELDS.intersection(record):
+            value = record[key]
+            if value and len(value) > truncate:
+                record[key] = value[:truncate] + "..."
+    return record
+
+
+def _parse_fields(fields: str | None) -> set[str] | None:
+    """Split a comma-separated ?fields= value."""
+    if fields is None:
+        return None
+    return {name.strip() for name in fields.split(",") if name.strip()}
+
+
 def create_router(
     orchestrator: Orchestrator,
     file_channel: FileChannel,
@@ -63,44 +93,95 @@ def create_router(
     # === Agents ===
 
     @router.get("/agents", response_model=list[AgentResponse])
-    async def list_agents(agent_type: str | None = None):
-        """List all agents."""
+    async def list_agents(
+        agent_type: str | None = None,
+        fields: str | None = None,
+        truncate: int | None = Query(default=None, ge=1),
+    ):
+        """List all agents.
+
+        ``fields`` (comma-separated) returns only those keys of each agent,
+        and ``truncate`` cuts goals, tasks and errors to that many characters.
+        """
         type_filter = AgentType(agent_type) if agent_type else None
         agents = await orchestrator.agent_manager.list_agents(type_filter)
-        return [AgentResponse(**a.to_dict()) for a in agents]
+        keys = _parse_fields(fields)
+        records = [_trim(a.to_dict(), keys, truncate) for a in agents]
+        if keys is not None:
+            # Partial records don't fit AgentResponse; send them as they are
+            return ORJSONResponse(content=records)
+        return [AgentResponse(**r) for r in records]
 
     @router.get("/agents/{agent_id}", response_model=AgentResponse)
-    async def get_agent(agent_id: str):
-        """Get a specific agent."""
+    async def get_agent(
+        agent_id: str,
+        recent_output: int = Query(default=0, ge=0),
+        truncate: int | None = Query(default=None, ge=1),
+    ):
+        """Get a specific agent.
+
+        With ``recent_output``, the newest that many output lines are included
+        as ``recentOutput``, their content cut to ``truncate`` characters.
+        """
         agent = await orchestrator.agent_manager.get_agent(agent_id)
         if not agent:
             raise HTTPException(status_code=404, detail="Agent not found")
-        return AgentResponse(**agent.to_dict())
+        data = agent.to_dict()
+        if recent_output:
+            data["recentOutput"] = [
+                _trim(line.to_dict(), None, truncate)
+                for line in agent.get_output_since(0, limit=recent_output)
+            ]
+        return AgentResponse(**data)
 
     @router.get("/agents/{agent_id}/output", response_model=AgentOutputResponse)
     async def get_agent_output(
         agent_id: str,
         limit: int = 100,
         offset: int = 0,
+        since: int | None = None,
+        fields: str | None = None,
+        truncate: int | None = Query(default=None, ge=1),
     ):
-        """Get agent output buffer."""
+        """Get agent output buffer.
+
+        With ``since`` (a previous response's ``nextSeq``), returns only the
+        newest ``limit`` lines added after it and ignores ``offset``.
+        ``fields`` and ``truncate`` trim each line as in ``list_agents``.
+        """
         agent = await orchestrator.agent_manager.get_agent(agent_id)
         if not agent:
             raise HTTPException(status_code=404, detail="Agent not found")
 
-        lines = agent.get_output(limit=limit, offset=offset)
+        if since is not None:
+            lines = agent.get_output_since(since, limit=limit)
+        else:
+            lines = agent.get_output(limit=limit, offset=offset)
+        keys = _parse_fields(fields)
+        if keys is not None:
+            return ORJSONResponse(content={
+                "agentId": agent_id,
+                "lines": [_trim(line.to_dict(), keys, truncate) for line in lines],
+                "totalLines": len(agent.output_buffer),
+                "nextSeq": agent.output_seq,
+            })
         return AgentOutputResponse(
             agentId=agent_id,
             lines=[
-                {
-                    "timestamp": line.timestamp,
-                    "content": line.content,
-                    "type": line.line_type,
-                    "metadata": line.metadata,
-                }
+                _trim(
+                    {
+                        "timestamp": line.timestamp,
+                        "content": line.content,
+                        "type": line.line_type,
+                        "metadata": line.metadata or {},
+                    },
+                    None,
+                    truncate,
+                )
                 for line in lines
             ],
             totalLines=len(agent.output_buffer),
+            nextSeq=agent.output_seq,
         )
 
     @router.post("/agents", response_model=AgentResponse)
@@ -111,10 +192,15 @@ def create_router(
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid agent type")
 
-        agent = await orchestrator.agent_manager.spawn_agent(
-            agent_type,
-            agent_id=request.agentId,
-        )
+        try:
+            agent = await orchestrator.agent_manager.spawn_agent(
+                agent_type,
+                agent_id=request.agentId,
+            )
+        except DuplicateAgentError as e:
+            raise HTTPException(status_code=409, detail=str(e)) from e
+        if request.prompt:
+            await orchestrator.agent_manager.start_agent(agent.id, request.prompt)
         return AgentResponse(**agent.to_dict())
 
     @router.post("/agents/{agent_id}/start", response_model=OrchestratorResponse)
@@ -175,7 +261,7 @@ def create_router(
     @router.get("/cycles", response_model=CycleListResponse)
     async def list_cycles(limit: int = 20, offset: int = 0):
         """List evolution cycles."""
-        cycles = orchestrator.cycles_history
+        cycles = list(orchestrator.cycles_history)  # Bounded deque; copy to slice
         total = len(cycles)
         cycles = cycles[offset : offset + limit]
         return CycleListResponse(
@@ -186,9 +272,9 @@ def create_router(
     @router.get("/cycles/{cycle_num}", response_model=CycleResponse)
     async def get_cycle(cycle_num: int):
         """Get a specific cycle."""
-        for cycle in orchestrator.cycles_history:
-            if cycle.cycle == cycle_num:
-                return CycleResponse(**cycle.to_dict())
+        cycle = await orchestrator.get_cycle(cycle_num)
+        if cycle is not None:
+            return CycleResponse(**cycle)
         raise HTTPException(status_code=404, detail="Cycle not found")
 
     # === Prompts ===
@@ -318,7 +404,7 @@ def create_router(
     async def get_usage(days: int = 7):
         """Get usage statistics."""
         today_usage = orchestrator.agent_manager.get_today_usage()
-        history = orchestrator.agent_manager.get_usage_history(days)
+        history = orchestrator.agent_manager.iter_usage_history(days)
 
         return UsageHistoryResponse(
             today=DailyUsageResponse(**today_usage.to_dict()),
@@ -436,6 +522,35 @@ def create_router(
 
     # === Bulk Operations ===
 
+    @router.post("/agents/bulk", response_model=list[AgentResponse])
+    async def bulk_spawn_agents(request: BulkSpawnRequest):
+        """Spawn multiple agents, starting those given a prompt."""
+        import asyncio
+
+        agent_manager = orchestrator.agent_manager
+
+        # Refuse the whole batch up front rather than spawning part of it
+        agent_ids = [item.agentId for item in request.agents if item.agentId]
+        if len(set(agent_ids)) != len(agent_ids):
+            raise HTTPException(status_code=409, detail="Duplicate agent IDs in request")
+        taken = [agent_id for agent_id in agent_ids if agent_id in agent_manager.agents]
+        if taken:
+            raise HTTPException(
+                status_code=409, detail=f"Agents already exist: {', '.join(taken)}"
+            )
+
+        async def spawn(item: SpawnAgentRequest) -> AgentResponse:
+            agent = await agent_manager.spawn_agent(AgentType(item.type), agent_id=item.agentId)
+            if item.prompt:
+                await agent_manager.start_agent(agent.id, item.prompt)
+            return AgentResponse(**agent.to_dict())
+
+        try:
+            return await asyncio.gather(*(spawn(item) for item in request.agents))
+        except DuplicateAgentError as e:
+            # An ID was taken between the check above and the spawn
+            raise HTTPException(status_code=409, detail=str(e)) from e
+
     @router.post("/agents/bulk/guidance", response_model=OrchestratorResponse)
     async def bulk_inject_guidance(request: BulkGuidanceRequest):
         """Inject guidance into multiple agents."""
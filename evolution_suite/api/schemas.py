@@ -30,6 +30,15 @@ class AgentRelationshipResponse(BaseModel):
     createdAt: datetime
 
 
+class AgentOutputLine(BaseModel):
+    """A single line of agent output."""
+
+    timestamp: datetime
+    content: str
+    type: str
+    metadata: dict[str, Any] = Field(default_factory=dict)
+
+
 class AgentResponse(BaseModel):
     """Response for a single agent."""
 
@@ -50,15 +59,7 @@ class AgentResponse(BaseModel):
     assignedBy: str | None = None
     delegatedTo: list[str] = Field(default_factory=list)
     waitingFor: str | None = None
-
-
-class AgentOutputLine(BaseModel):
-    """A single line of agent output."""
-
-    timestamp: datetime
-    content: str
-    type: str
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    recentOutput: list[AgentOutputLine] | None = None  # Only with ?recent_output=
 
 
 class AgentOutputResponse(BaseModel):
@@ -67,6 +68,7 @@ class AgentOutputResponse(BaseModel):
     agentId: str
     lines: list[AgentOutputLine]
     totalLines: int
+    nextSeq: int = 0  # Pass as ?since= to get only the lines added after this response
 
 
 class SpawnAgentRequest(BaseModel):
@@ -74,6 +76,7 @@ class SpawnAgentRequest(BaseModel):
 
     type: str = Field(..., pattern="^(coordinator|worker|evaluator)$")
     agentId: str | None = None
+    prompt: str | None = Field(default=None, min_length=1)  # Start the agent right away
 
 
 class GuidanceRequest(BaseModel):
@@ -235,6 +238,12 @@ class BulkGuidanceRequest(BaseModel):
     content: str = Field(..., min_length=1)
 
 
+class BulkSpawnRequest(BaseModel):
+    """Request to spawn several agents at once."""
+
+    agents: list[SpawnAgentRequest] = Field(..., min_length=1)
+
+
 class BulkActionRequest(BaseModel):
     """Request for bulk agent actions."""
 
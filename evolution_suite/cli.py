@@ -1,8 +1,9 @@
 """Evolution Suite CLI - Command line interface for managing evolution agents."""
 
 import sys
+from collections.abc import Coroutine
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import typer
 from rich.console import Console
@@ -31,6 +32,19 @@ def get_project_root() -> Path:
     return Path.cwd()
 
 
+def run_async(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    import asyncio
+
+    try:
+        import uvloop  # Installed on POSIX with uvicorn[standard]
+    except ImportError:
+        return asyncio.run(main)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
+
+
 @app.command()
 def init(
     path: Optional[Path] = typer.Argument(None, help="Project path (default: current directory)"),
@@ -130,8 +144,6 @@ def start(
     no_browser: bool = typer.Option(False, "--no-browser", help="Don't open browser"),
 ):
     """Start the evolution dashboard and orchestrator."""
-    import asyncio
-
     from evolution_suite.server import run_server
 
     project_root = get_project_root()
@@ -148,7 +160,7 @@ def start(
         border_style="cyan",
     ))
 
-    asyncio.run(run_server(
+    run_async(run_server(
         project_root=project_root,
         host=host,
         port=port,
@@ -163,8 +175,6 @@ def run(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ):
     """Run evolution headless (no dashboard)."""
-    import asyncio
-
     from evolution_suite.core.orchestrator import Orchestrator
     from evolution_suite.core.config import load_config
 
@@ -186,7 +196,7 @@ def run(
     ))
 
     try:
-        asyncio.run(orchestrator.run(
+        run_async(orchestrator.run(
             max_cycles=max_cycles,
             dry_run=dry_run,
             verbose=verbose,
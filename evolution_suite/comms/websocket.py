@@ -3,26 +3,147 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
+import logging
+from collections import deque
 from datetime import datetime
 from typing import Any, Callable
 
 from fastapi import WebSocket, WebSocketDisconnect
 
+logger = logging.getLogger(__name__)
+
+
+# Output messages held for a connection that is not keeping up; older ones are dropped past this
+SEND_QUEUE_SIZE = 256
+
+# Other messages a connection may have pending before it is closed as too slow to serve
+CONTROL_QUEUE_SIZE = 1024
+
+# How long a closed-as-too-slow client gets to take the close frame
+EVICT_CLOSE_SECONDS = 2.0
+
+# Message types a lagging client may lose; status and lifecycle events are always delivered
+_DROPPABLE_TYPES = frozenset({"agent_output", "agent_output_batch", "agent_tool_use"})
+
+
+def _latest(pending: dict[str, Any], message: dict[str, Any]) -> dict[str, Any]:
+    return message
+
+
+def _sum_usage(pending: dict[str, Any], message: dict[str, Any]) -> dict[str, Any]:
+    # usage_update carries the usage since the previous one, so queued ones add up
+    metrics = dict(pending["metrics"])
+    for name, value in message["metrics"].items():
+        metrics[name] = metrics.get(name, 0) + value
+    return {**message, "metrics": metrics}
+
+
+# Per-agent state events; a queued one is merged with newer ones for the same
+# agent instead of each taking a slot
+_STATE_MERGERS: dict[str, Callable[[dict[str, Any], dict[str, Any]], dict[str, Any]]] = {
+    "agent_status": _latest,
+    "usage_update": _sum_usage,
+}
+
+
+def _encode(message: dict[str, Any]) -> str:
+    """Serialize a message the way WebSocket.send_json does."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+class _Outbox:
+    """A connection's pending messages, in send order.
+
+    Droppable messages and the rest are queued separately and interleaved by
+    sequence number. Past SEND_QUEUE_SIZE droppable messages the oldest is
+    discarded for each new one. State events merge into the one already
+    queued for their agent. Anything else is kept until CONTROL_QUEUE_SIZE
+    are waiting, after which put() reports the connection as overflowed.
+    """
+
+    __slots__ = ("_seq", "_output", "_control", "_state", "_ready", "overflowed")
+
+    def __init__(self):
+        self._seq = 0
+        self._output: deque[tuple[int, str]] = deque(maxlen=SEND_QUEUE_SIZE)
+        # [seq, text, state key or None, message for state events]
+        self._control: deque[list[Any]] = deque()
+        self._state: dict[tuple[str, str], list[Any]] = {}
+        self._ready = asyncio.Event()
+        self.overflowed = False
+
+    def __len__(self) -> int:
+        return len(self._output) + len(self._control)
+
+    def put_droppable(self, text: str) -> None:
+        self._seq += 1
+        self._output.append((self._seq, text))
+        self._ready.set()
+
+    def put(self, text: str) -> bool:
+        """Queue a message; False if the connection is too far behind to keep."""
+        return self._put_control(text, None, None)
+
+    def put_state(self, key: tuple[str, str], message: dict[str, Any], text: str) -> bool:
+        """Queue a state event, merging it into a pending one with the same key."""
+        slot = self._state.get(key)
+        if slot is None:
+            return self._put_control(text, key, message)
+        merged = _STATE_MERGERS[key[0]](slot[3], message)
+        slot[1] = text if merged is message else _encode(merged)
+        slot[3] = merged
+        return True
+
+    def _put_control(
+        self, text: str, key: tuple[str, str] | None, message: dict[str, Any] | None,
+    ) -> bool:
+        if len(self._control) >= CONTROL_QUEUE_SIZE:
+            self.overflowed = True
+            return False
+        self._seq += 1
+        slot = [self._seq, text, key, message]
+        self._control.append(slot)
+        if key is not None:
+            self._state[key] = slot
+        self._ready.set()
+        return True
+
+    async def get(self) -> str:
+        while not (self._output or self._control):
+            self._ready.clear()
+            await self._ready.wait()
+        if self._output and (not self._control or self._output[0][0] < self._control[0][0]):
+            return self._output.popleft()[1]
+        _, text, key, _ = self._control.popleft()
+        if key is not None:
+            del self._state[key]
+        return text
+
 
 class WebSocketManager:
-    """Manages WebSocket connections and broadcasts events."""
+    """Manages WebSocket connections and broadcasts events.
+
+    Each connection has a send queue drained by its own writer task, so
+    publishing never waits on a client. A slow client loses its own oldest
+    agent output and gets coalesced state events; one that still falls
+    CONTROL_QUEUE_SIZE messages behind is closed.
+    """
 
     def __init__(self):
-        self.connections: list[WebSocket] = []
+        self.connections: dict[WebSocket, _Outbox] = {}
+        self._writers: dict[WebSocket, asyncio.Task[None]] = {}
         self._lock = asyncio.Lock()
         self._message_handlers: dict[str, Callable] = {}
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept a new WebSocket connection."""
         await websocket.accept()
+        outbox = _Outbox()
         async with self._lock:
-            self.connections.append(websocket)
+            self.connections[websocket] = outbox
+            self._writers[websocket] = asyncio.create_task(self._write(websocket, outbox))
 
         # Send connection confirmation
         await self.send_to(websocket, {
@@ -34,18 +155,48 @@ class WebSocketManager:
     async def disconnect(self, websocket: WebSocket) -> None:
         """Remove a WebSocket connection."""
         async with self._lock:
-            if websocket in self.connections:
-                self.connections.remove(websocket)
+            self.connections.pop(websocket, None)
+            writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
 
-    async def send_to(self, websocket: WebSocket, message: dict[str, Any]) -> None:
-        """Send a message to a specific connection."""
+    def _evict(self, websocket: WebSocket) -> None:
+        """Drop a connection whose queue overflowed; its writer closes the socket."""
+        outbox = self.connections.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if outbox is not None:
+            logger.warning("Closing WebSocket client %d messages behind", len(outbox))
+        if writer is not None:
+            writer.cancel()
+
+    async def _write(self, websocket: WebSocket, outbox: _Outbox) -> None:
+        """Send a connection's queued messages in order until it fails."""
         try:
-            await websocket.send_json(message)
+            while True:
+                await websocket.send_text(await outbox.get())
+        except asyncio.CancelledError:
+            if outbox.overflowed:
+                # Best effort; a client this far behind may not take the frame
+                with contextlib.suppress(Exception):
+                    await asyncio.wait_for(
+                        websocket.close(code=1013), timeout=EVICT_CLOSE_SECONDS,
+                    )
+            raise
         except Exception:
             await self.disconnect(websocket)
 
-    async def broadcast(self, message: dict[str, Any]) -> None:
-        """Broadcast a message to all connections."""
+    async def send_to(self, websocket: WebSocket, message: dict[str, Any]) -> None:
+        """Queue a message for a specific connection."""
+        outbox = self.connections.get(websocket)
+        if outbox is not None and not outbox.put(_encode(message)):
+            self._evict(websocket)
+
+    def publish(self, message: dict[str, Any]) -> None:
+        """Queue a message for all connections without waiting on any of them.
+
+        This runs inside agent and orchestrator callbacks, so it never raises;
+        a message that can't be serialized is logged and dropped.
+        """
         if not self.connections:
             return
 
@@ -53,20 +204,36 @@ class WebSocketManager:
         if "timestamp" not in message:
             message["timestamp"] = datetime.now().isoformat()
 
-        # Send to all connections, removing dead ones
-        dead_connections = []
-        for connection in self.connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                dead_connections.append(connection)
+        # Serialize once for every connection
+        try:
+            text = _encode(message)
+        except (TypeError, ValueError):
+            logger.exception("Dropping unserializable %s event", message.get("type"))
+            return
+        message_type = message.get("type")
+        if message_type in _DROPPABLE_TYPES:
+            for outbox in self.connections.values():
+                outbox.put_droppable(text)
+            return
+
+        agent_id = message.get("agentId")
+        if message_type in _STATE_MERGERS and isinstance(agent_id, str):
+            key = (message_type, agent_id)
+            overflowed = [
+                websocket for websocket, outbox in self.connections.items()
+                if not outbox.put_state(key, message, text)
+            ]
+        else:
+            overflowed = [
+                websocket for websocket, outbox in self.connections.items()
+                if not outbox.put(text)
+            ]
+        for websocket in overflowed:
+            self._evict(websocket)
 
-        # Clean up dead connections
-        if dead_connections:
-            async with self._lock:
-                for conn in dead_connections:
-                    if conn in self.connections:
-                        self.connections.remove(conn)
+    async def broadcast(self, message: dict[str, Any]) -> None:
+        """Broadcast a message to all connections."""
+        self.publish(message)
 
     def register_handler(self, message_type: str, handler: Callable) -> None:
         """Register a handler for a specific message type."""
@@ -116,10 +283,9 @@ class WebSocketManager:
                     await self.handle_message(websocket, data)
                 except asyncio.TimeoutError:
                     # Send ping to keep connection alive
-                    try:
-                        await websocket.send_json({"type": "ping"})
-                    except Exception:
+                    if websocket not in self.connections:
                         break
+                    await self.send_to(websocket, {"type": "ping"})
         except WebSocketDisconnect:
             await self.disconnect(websocket)
         except Exception:
@@ -131,6 +297,4 @@ class WebSocketManager:
 
     def create_event_callback(self) -> Callable[[dict[str, Any]], None]:
         """Create a callback that broadcasts events."""
-        def callback(event: dict[str, Any]) -> None:
-            asyncio.create_task(self.broadcast(event))
-        return callback
+        return self.publish
@@ -1,7 +1,7 @@
 """Core components for evolution suite."""
 
 from evolution_suite.core.agent import Agent, AgentStatus, AgentType
-from evolution_suite.core.agent_manager import AgentManager
+from evolution_suite.core.agent_manager import AgentManager, DuplicateAgentError
 from evolution_suite.core.config import Config, load_config
 from evolution_suite.core.orchestrator import Orchestrator
 
@@ -10,6 +10,7 @@ __all__ = [
     "AgentStatus",
     "AgentType",
     "AgentManager",
+    "DuplicateAgentError",
     "Config",
     "load_config",
     "Orchestrator",
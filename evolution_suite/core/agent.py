@@ -6,17 +6,45 @@ import asyncio
 import json
 import time
 import uuid
+import zlib
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, AsyncIterator, Callable
 
+import orjson
+
 if TYPE_CHECKING:
     from evolution_suite.core.config import Config
 
 
+# Max bytes buffered for a single stream-json line; large Write/Edit tool
+# inputs arrive as one line and overrun asyncio's 64KB default
+STREAM_LIMIT = 16 * 1024 * 1024
+
+# How long to keep reading after the process exits before giving up on a
+# stdout pipe still held open by a child
+EXIT_DRAIN_SECONDS = 2.0
+
+# Consecutive text/thinking deltas are merged into one output line, flushed
+# at most this long after the first pending delta arrived
+DELTA_FLUSH_SECONDS = 0.05
+
+# Output lines older than the newest OUTPUT_HOT_LINES are kept zlib-compressed
+# when their content is at least OUTPUT_PACK_MIN_CHARS long; readers mostly
+# want the tail, so cold thinking/text blocks are rarely decompressed
+OUTPUT_HOT_LINES = 500
+OUTPUT_PACK_MIN_CHARS = 256
+
+
+# Key holding the text of each assistant content block / streamed delta type
+_CONTENT_TEXT_KEYS = {"thinking": "thinking", "text": "text"}
+_DELTA_TEXT_KEYS = {"thinking_delta": "thinking", "text_delta": "text"}
+
+
 class AgentType(str, Enum):
     """Types of agents in the evolution system."""
 
@@ -37,7 +65,36 @@ class AgentStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+# Static claude CLI arguments; start() only splices in the prompt
+_CMD_PREFIX = (
+    "claude",
+    "--verbose",
+    "--output-format", "stream-json",
+    "--dangerously-skip-permissions",  # Run fully autonomously
+    "-p",  # Print mode with prompt as immediate argument
+)
+_CMD_TYPE_ARGS: dict[AgentType, tuple[str, ...]] = {
+    # Coordinators use the HTTP API instead of the Task tool
+    # (--disallowedTools avoids the variadic --tools issue)
+    AgentType.COORDINATOR: ("--disallowedTools", "Task"),
+    AgentType.WORKER: (),
+    # Headless + isolated Playwright MCP prevents window focus conflicts
+    AgentType.EVALUATOR: (
+        "--mcp-config",
+        json.dumps({
+            "mcpServers": {
+                "playwright": {
+                    "command": "npx",
+                    "args": ["@playwright/mcp@latest", "--headless", "--isolated"]
+                }
+            }
+        }),
+        "--strict-mcp-config",
+    ),
+}
+
+
+@dataclass(slots=True)
 class UsageMetrics:
     """Token usage and cost metrics."""
 
@@ -58,6 +115,18 @@ class UsageMetrics:
             "requests": self.requests,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> UsageMetrics:
+        """Rebuild metrics from the output of to_dict()."""
+        return cls(
+            input_tokens=data.get("inputTokens", 0),
+            output_tokens=data.get("outputTokens", 0),
+            cache_read_tokens=data.get("cacheReadTokens", 0),
+            cache_creation_tokens=data.get("cacheCreationTokens", 0),
+            cost_usd=data.get("costUsd", 0.0),
+            requests=data.get("requests", 0),
+        )
+
     def add(self, other: "UsageMetrics") -> None:
         """Add another UsageMetrics to this one."""
         self.input_tokens += other.input_tokens
@@ -77,40 +146,68 @@ MODEL_PRICING = {
     "default": {"input": 3.0, "output": 15.0},
 }
 
+# Per-token (input, output) prices, derived once from MODEL_PRICING
+_TOKEN_PRICES = {
+    model: (pricing["input"] / 1_000_000, pricing["output"] / 1_000_000)
+    for model, pricing in MODEL_PRICING.items()
+}
+
 
 def calculate_cost(input_tokens: int, output_tokens: int, model: str = "default") -> float:
     """Calculate cost in USD for given token counts."""
-    pricing = MODEL_PRICING.get(model, MODEL_PRICING["default"])
-    input_cost = (input_tokens / 1_000_000) * pricing["input"]
-    output_cost = (output_tokens / 1_000_000) * pricing["output"]
-    return round(input_cost + output_cost, 6)
+    price_in, price_out = _TOKEN_PRICES.get(model) or _TOKEN_PRICES["default"]
+    return round(input_tokens * price_in + output_tokens * price_out, 6)
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputLine:
     """A single line of agent output."""
 
-    timestamp: datetime
     content: str
     line_type: str  # thinking, text, tool_use, tool_result, error
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] | None = None  # Most lines have none; skip the empty dict
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
     def to_dict(self) -> dict[str, Any]:
         return {
             "timestamp": self.timestamp.isoformat(),
             "content": self.content,
             "type": self.line_type,
-            "metadata": self.metadata,
+            "metadata": self.metadata or {},
         }
 
 
-@dataclass
+class PackedOutputLine(OutputLine):
+    """An OutputLine whose content is stored zlib-compressed."""
+
+    __slots__ = ("_packed",)
+
+    def __init__(self, line: OutputLine):
+        self._packed = zlib.compress(line.content.encode(), 1)
+        self.line_type = line.line_type
+        self.metadata = line.metadata
+        self.timestamp_ns = line.timestamp_ns
+
+    @property
+    def content(self) -> str:
+        return zlib.decompress(self._packed).decode()
+
+
+@dataclass(slots=True)
 class ToolUse:
     """Record of a tool invocation."""
 
     tool_name: str
     tool_input: dict[str, Any]
-    timestamp: datetime
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -120,6 +217,22 @@ class ToolUse:
         }
 
 
+class _ExitSignalProtocol(asyncio.subprocess.SubprocessStreamProtocol):
+    """Stream protocol that also signals the moment the child process exits.
+
+    Process.wait() only resolves once the pipes close too, which a lingering
+    grandchild can hold open long after the process itself is gone.
+    """
+
+    def __init__(self, limit: int, loop: asyncio.AbstractEventLoop):
+        super().__init__(limit=limit, loop=loop)
+        self.exited = asyncio.Event()
+
+    def process_exited(self) -> None:
+        super().process_exited()
+        self.exited.set()
+
+
 class Agent:
     """Wraps a Claude subprocess with streaming output and lifecycle management."""
 
@@ -132,16 +245,24 @@ class Agent:
         on_tool_use: Callable[[ToolUse], None] | None = None,
         on_status_change: Callable[[AgentStatus], None] | None = None,
         on_usage: Callable[["UsageMetrics"], None] | None = None,
+        on_output_batch: Callable[[list[OutputLine]], None] | None = None,
     ):
+        self._snapshot: dict[str, Any] | None = None  # Cached to_dict() fields
         self.id = agent_id or f"{agent_type.value}-{uuid.uuid4().hex[:8]}"
         self.type = agent_type
         self.config = config
+        self._agent_config = getattr(config.agents, agent_type.value)
         self.status = AgentStatus.IDLE
         self.process: asyncio.subprocess.Process | None = None
+        self._process_exited = asyncio.Event()  # Set once the current process exits
         self.output_buffer: deque[OutputLine] = deque(maxlen=10000)
-        self.tools_used: list[ToolUse] = []
-        self.files_modified: list[str] = []
-        self.current_task: str | None = None
+        self.output_seq = 0  # Lines ever added; the buffer holds the last len(buffer) of them
+        self.tools_used: deque[ToolUse] = deque(maxlen=config.agents.tools_used_max)
+        # Totals for the run; tools_used only keeps the newest records
+        self.tool_use_count = 0
+        self.tool_counts: dict[str, int] = {}
+        self.files_modified: dict[str, None] = {}  # Ordered set of filenames
+        self._current_task: str | None = None
         self.goal: str | None = None  # The overarching objective for this agent
         self.started_at: datetime | None = None
         self.finished_at: datetime | None = None
@@ -149,40 +270,154 @@ class Agent:
 
         # Usage tracking
         self.usage_metrics = UsageMetrics()
-        self.model: str = "default"
+        self._set_model("default")
 
         # Relationship tracking
-        self.assigned_by: str | None = None  # ID of agent that delegated to this one
+        self._assigned_by: str | None = None  # ID of agent that delegated to this one
         self.delegated_to: list[str] = []  # IDs of agents this one assigned work to
-        self.waiting_for: str | None = None  # ID of agent blocking this one
+        self._waiting_for: str | None = None  # ID of agent blocking this one
+
+        # Guidance file path; the id never changes, so resolve it once
+        self._guidance_file = config.get_guidance_dir() / f"{self.id}.md"
+        self._guidance_dir_created = False
 
         # Callbacks
-        self._on_output = on_output
-        self._on_tool_use = on_tool_use
-        self._on_status_change = on_status_change
-        self._on_usage = on_usage
+        self.set_callbacks(
+            on_output=on_output,
+            on_tool_use=on_tool_use,
+            on_status_change=on_status_change,
+            on_usage=on_usage,
+            on_output_batch=on_output_batch,
+        )
+
+        # Pending streamed deltas, merged before buffering
+        self._delta_type: str | None = None
+        self._delta_chunks: list[str] = []
+        self._delta_flush_handle: asyncio.TimerHandle | None = None
 
         # Control flags
-        self._should_stop = False
-        self._paused = False
+        self._stop_event = asyncio.Event()
         self._pause_event = asyncio.Event()
         self._pause_event.set()  # Not paused initially
+        self._done_event = asyncio.Event()
+        self._done_event.set()  # Cleared while a run is in progress
 
-    def _set_status(self, status: AgentStatus) -> None:
-        """Update status and notify callback."""
-        self.status = status
-        if self._on_status_change:
-            self._on_status_change(status)
+    # Fields serialised by to_dict() drop the cached snapshot when they change.
+    # Those set from outside the class do it through these setters.
 
-    def _add_output(self, line: OutputLine) -> None:
-        """Add output line and notify callback."""
-        self.output_buffer.append(line)
-        if self._on_output:
-            self._on_output(line)
+    @property
+    def current_task(self) -> str | None:
+        return self._current_task
+
+    @current_task.setter
+    def current_task(self, value: str | None) -> None:
+        self._current_task = value
+        self._snapshot = None
+
+    @property
+    def assigned_by(self) -> str | None:
+        return self._assigned_by
+
+    @assigned_by.setter
+    def assigned_by(self, value: str | None) -> None:
+        self._assigned_by = value
+        self._snapshot = None
+
+    @property
+    def waiting_for(self) -> str | None:
+        return self._waiting_for
+
+    @waiting_for.setter
+    def waiting_for(self, value: str | None) -> None:
+        self._waiting_for = value
+        self._snapshot = None
+
+    def add_delegation(self, agent_id: str) -> None:
+        """Record that this agent delegated work to another agent."""
+        self.delegated_to.append(agent_id)
+        self._snapshot = None
+
+    def set_callbacks(
+        self,
+        on_output: Callable[[OutputLine], None] | None = None,
+        on_tool_use: Callable[[ToolUse], None] | None = None,
+        on_status_change: Callable[[AgentStatus], None] | None = None,
+        on_usage: Callable[[UsageMetrics], None] | None = None,
+        on_output_batch: Callable[[list[OutputLine]], None] | None = None,
+    ) -> None:
+        """Register event callbacks.
+
+        ``_add_output``, ``_add_outputs`` and ``_set_status`` run once per
+        streamed line, so they are rebuilt here for the given callbacks instead
+        of checking for a callback on every call. Lines emitted together (the
+        content blocks of one message) go to ``on_output_batch`` when set, and
+        fall back to one ``on_output`` call per line otherwise.
+        """
+        self._on_output = on_output
+        self._on_tool_use = on_tool_use
+        self._on_status_change = on_status_change
+        self._on_usage = on_usage
+        self._on_output_batch = on_output_batch
+
+        buffer = self.output_buffer
+
+        def pack_cold(count: int) -> None:
+            # Compress the lines that just dropped out of the hot tail
+            end = len(buffer) - OUTPUT_HOT_LINES
+            for i in range(max(end - count, 0), end):
+                line = buffer[i]
+                if type(line) is OutputLine and len(line.content) >= OUTPUT_PACK_MIN_CHARS:
+                    buffer[i] = PackedOutputLine(line)
+
+        def append(line: OutputLine) -> None:
+            buffer.append(line)
+            self.output_seq += 1
+            if len(buffer) > OUTPUT_HOT_LINES:
+                pack_cold(1)
+
+        def extend(lines: list[OutputLine]) -> None:
+            buffer.extend(lines)
+            self.output_seq += len(lines)
+            if len(buffer) > OUTPUT_HOT_LINES:
+                pack_cold(len(lines))
+
+        if on_output:
+            def add_output(line: OutputLine) -> None:
+                append(line)
+                on_output(line)
+        else:
+            add_output = append
+        self._add_output = add_output
+
+        if on_output_batch:
+            def add_outputs(lines: list[OutputLine]) -> None:
+                extend(lines)
+                on_output_batch(lines)
+        elif on_output:
+            def add_outputs(lines: list[OutputLine]) -> None:
+                extend(lines)
+                for line in lines:
+                    on_output(line)
+        else:
+            add_outputs = extend
+        self._add_outputs = add_outputs
+
+        if on_status_change:
+            def set_status(status: AgentStatus) -> None:
+                self.status = status
+                self._snapshot = None
+                on_status_change(status)
+        else:
+            def set_status(status: AgentStatus) -> None:
+                self.status = status
+                self._snapshot = None
+        self._set_status = set_status
 
     def _add_tool_use(self, tool: ToolUse) -> None:
         """Record tool use and notify callback."""
         self.tools_used.append(tool)
+        self.tool_use_count += 1
+        self.tool_counts[tool.tool_name] = self.tool_counts.get(tool.tool_name, 0) + 1
         if self._on_tool_use:
             self._on_tool_use(tool)
 
@@ -190,9 +425,14 @@ class Agent:
         if tool.tool_name in ("Edit", "Write"):
             file_path = tool.tool_input.get("file_path", "")
             if file_path:
-                filename = Path(file_path).name
-                if filename not in self.files_modified:
-                    self.files_modified.append(filename)
+                self.files_modified[Path(file_path).name] = None
+                self._snapshot = None
+
+    def _set_model(self, model: str) -> None:
+        """Set the model and cache its per-token prices for cost tracking."""
+        self.model = model
+        self._snapshot = None
+        self._price_in, self._price_out = _TOKEN_PRICES.get(model) or _TOKEN_PRICES["default"]
 
     def _update_usage(self, usage_data: dict[str, Any]) -> None:
         """Update usage metrics from Claude API response."""
@@ -202,28 +442,32 @@ class Agent:
         cache_creation = usage_data.get("cache_creation_input_tokens", 0)
 
         # Calculate cost
-        cost = calculate_cost(input_tokens, output_tokens, self.model)
-
-        # Create metrics for this request
-        request_metrics = UsageMetrics(
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cache_read_tokens=cache_read,
-            cache_creation_tokens=cache_creation,
-            cost_usd=cost,
-            requests=1,
-        )
-
-        # Add to cumulative metrics
-        self.usage_metrics.add(request_metrics)
-
-        # Notify callback
+        cost = round(input_tokens * self._price_in + output_tokens * self._price_out, 6)
+
+        # Add to cumulative metrics in place
+        totals = self.usage_metrics
+        totals.input_tokens += input_tokens
+        totals.output_tokens += output_tokens
+        totals.cache_read_tokens += cache_read
+        totals.cache_creation_tokens += cache_creation
+        totals.cost_usd += cost
+        totals.requests += 1
+        self._snapshot = None
+
+        # Per-request metrics are only materialised for the callback
         if self._on_usage:
-            self._on_usage(request_metrics)
+            self._on_usage(UsageMetrics(
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cache_read_tokens=cache_read,
+                cache_creation_tokens=cache_creation,
+                cost_usd=cost,
+                requests=1,
+            ))
 
     def get_guidance_file(self) -> Path:
         """Get path to this agent's guidance file."""
-        return self.config.get_guidance_dir() / f"{self.id}.md"
+        return self._guidance_file
 
     def read_guidance(self) -> str | None:
         """Read injected guidance for this agent."""
@@ -245,18 +489,18 @@ class Agent:
         With -p mode, we can't inject into a running process.
         The guidance is stored and will be included when the agent is continued.
         """
-        guidance_dir = self.config.get_guidance_dir()
-        guidance_dir.mkdir(parents=True, exist_ok=True)
+        if not self._guidance_dir_created:
+            self.config.get_guidance_dir().mkdir(parents=True, exist_ok=True)
+            self._guidance_dir_created = True
 
-        # Append to existing guidance if any
-        guidance_file = self.get_guidance_file()
-        existing = guidance_file.read_text() if guidance_file.exists() else ""
-        if existing:
-            content = existing + "\n\n---\n\n" + content
-        guidance_file.write_text(content)
+        # Append to existing guidance if any. An unbuffered O_APPEND write
+        # lands in one syscall, so existing guidance is never rewritten or
+        # truncated and concurrent injections don't clobber each other.
+        with open(self.get_guidance_file(), "ab", buffering=0) as f:
+            separator = "\n\n---\n\n" if f.tell() else ""
+            f.write((separator + content).encode("utf-8"))
 
         self._add_output(OutputLine(
-            timestamp=datetime.now(),
             content=f"[Guidance queued for next continuation: {content[:100]}...]",
             line_type="text",
             metadata={"queued_guidance": True},
@@ -268,14 +512,15 @@ class Agent:
             raise RuntimeError(f"Agent {self.id} is already running")
 
         self._set_status(AgentStatus.STARTING)
-        self._should_stop = False
-        self._paused = False
+        self._stop_event.clear()
         self._pause_event.set()
         self.started_at = datetime.now()
         self.finished_at = None
         self.error = None
-        self.tools_used = []
-        self.files_modified = []
+        self.tools_used.clear()
+        self.tool_use_count = 0
+        self.tool_counts = {}
+        self.files_modified = {}
 
         # Include any pending guidance in the prompt
         pending_guidance = self.read_guidance()
@@ -287,109 +532,111 @@ class Agent:
         first_line = prompt.strip().split('\n')[0]
         goal_value = first_line[:200] if len(first_line) > 200 else first_line
         self.goal = goal_value
-        self.current_task = goal_value
+        self.current_task = goal_value  # Drops the snapshot for the fields reset above
 
         # Get agent-specific timeout
-        agent_config = getattr(self.config.agents, self.type.value)
-        timeout_minutes = agent_config.timeout_minutes
+        timeout_minutes = self._agent_config.timeout_minutes
+        timeout_handle: asyncio.TimerHandle | None = None
+        self._done_event.clear()
 
         try:
-            # Build command arguments
             # Put prompt right after -p to ensure it's captured as the prompt argument
-            cmd_args = [
-                "claude",
-                "--verbose",
-                "--output-format", "stream-json",
-                "--dangerously-skip-permissions",  # Run fully autonomously
-                "-p", prompt,  # Print mode with prompt as immediate argument
-            ]
-
-            # For coordinators, disable Task tool so they use HTTP API instead
-            if self.type == AgentType.COORDINATOR:
-                # Use --disallowedTools to block specific tools (avoids variadic --tools issue)
-                cmd_args.extend(["--disallowedTools", "Task"])
-
-            # For evaluators, configure Playwright MCP in headless + isolated mode
-            if self.type == AgentType.EVALUATOR:
-                # MCP config for headless Playwright - prevents window focus conflicts
-                mcp_config = json.dumps({
-                    "mcpServers": {
-                        "playwright": {
-                            "command": "npx",
-                            "args": ["@playwright/mcp@latest", "--headless", "--isolated"]
-                        }
-                    }
-                })
-                cmd_args.extend(["--mcp-config", mcp_config, "--strict-mcp-config"])
-
-            # Use asyncio subprocess for proper async handling
-            self.process = await asyncio.create_subprocess_exec(
+            cmd_args = (*_CMD_PREFIX, prompt, *_CMD_TYPE_ARGS[self.type])
+
+            # Use asyncio subprocess for proper async handling. Keep the kwargs
+            # vfork-compatible (no preexec_fn, user, group, extra_groups or
+            # umask) so CPython spawns without copying the parent's page tables.
+            # Same construction as create_subprocess_exec, but with a protocol
+            # that reports the exit itself rather than only pipe closure.
+            loop = asyncio.get_running_loop()
+            transport, protocol = await loop.subprocess_exec(
+                lambda: _ExitSignalProtocol(STREAM_LIMIT, loop),
                 *cmd_args,
+                stdin=None,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=self.config.project_root,
             )
+            self.process = asyncio.subprocess.Process(transport, protocol, loop)
+            self._process_exited = protocol.exited
 
             self._set_status(AgentStatus.RUNNING)
 
+            # Arm a single timer instead of checking elapsed time per read
+            timeout_handle = loop.call_later(
+                timeout_minutes * 60, self._on_timeout, timeout_minutes,
+            )
+
             # Log the command being run for debugging
             self._add_output(OutputLine(
-                timestamp=datetime.now(),
                 content=f"[debug] PID={self.process.pid}, cwd={self.config.project_root}",
                 line_type="text",
             ))
             self._add_output(OutputLine(
-                timestamp=datetime.now(),
                 content=f"[debug] Command: {' '.join(cmd_args[:8])}...",
                 line_type="text",
             ))
             self._add_output(OutputLine(
-                timestamp=datetime.now(),
                 content=f"[debug] Prompt length: {len(prompt)} chars",
                 line_type="text",
             ))
 
             # Stream output and stderr concurrently
-            await self._stream_with_stderr(timeout_minutes * 60)
+            await self._stream_with_stderr()
 
         except Exception as e:
             self.error = str(e)
             self._set_status(AgentStatus.FAILED)
             self._add_output(OutputLine(
-                timestamp=datetime.now(),
                 content=f"Agent failed: {e}",
                 line_type="error",
             ))
 
         finally:
+            if timeout_handle:
+                timeout_handle.cancel()
             self.finished_at = datetime.now()
+            self._snapshot = None
             if self.status == AgentStatus.RUNNING:
                 self._set_status(AgentStatus.STOPPED)
+            self._done_event.set()
+
+    async def wait_done(self) -> None:
+        """Wait until the current run, if any, has finished."""
+        await self._done_event.wait()
 
-    async def _stream_with_stderr(self, timeout_seconds: float) -> None:
+    def _on_timeout(self, timeout_minutes: int) -> None:
+        """Kill the subprocess once the agent's time budget is spent."""
+        if not self.process or self.process.returncode is not None:
+            return
+        self.process.kill()
+        self.error = f"Timed out after {timeout_minutes} minutes"
+        self._set_status(AgentStatus.FAILED)
+        self._pause_event.set()  # Let a paused stream loop observe the exit
+
+    async def _stream_with_stderr(self) -> None:
         """Stream stdout and stderr concurrently from the subprocess."""
         if not self.process:
             return
 
         async def read_stderr():
-            """Read stderr and capture errors."""
+            """Drain stderr line by line, surfacing errors as they arrive."""
             if not self.process or not self.process.stderr:
                 return
+            stderr = self.process.stderr
             try:
-                stderr_data = await self.process.stderr.read()
-                if stderr_data:
-                    stderr_text = stderr_data.decode("utf-8", errors="replace").strip()
+                while line := await stderr.readline():
+                    stderr_text = line.decode("utf-8", errors="replace").strip()
                     if stderr_text:
                         self._add_output(OutputLine(
-                            timestamp=datetime.now(),
                             content=f"[stderr] {stderr_text}",
                             line_type="error",
                         ))
                         if not self.error:
                             self.error = stderr_text[:500]
+                            self._snapshot = None
             except Exception as e:
                 self._add_output(OutputLine(
-                    timestamp=datetime.now(),
                     content=f"[stderr read error] {e}",
                     line_type="error",
                 ))
@@ -399,7 +646,7 @@ class Agent:
 
         try:
             # Stream stdout
-            await self._stream_output(timeout_seconds)
+            await self._stream_output()
         finally:
             # Wait for stderr task to complete
             try:
@@ -407,203 +654,252 @@ class Agent:
             except asyncio.TimeoutError:
                 stderr_task.cancel()
 
-    async def _stream_output(self, timeout_seconds: float) -> None:
-        """Stream output from the subprocess using chunk-based reading."""
+    async def _stream_output(self) -> None:
+        """Stream output from the subprocess one newline-framed event at a time.
+
+        Waits on the next line, a stop request, and process exit together, so
+        the loop only wakes when there is something to do.
+        """
         if not self.process or not self.process.stdout:
             return
 
-        start_time = time.time()
-        buffer = b""
+        stdout = self.process.stdout
+        stop_task = asyncio.ensure_future(self._stop_event.wait())
+        exit_task = asyncio.ensure_future(self._process_exited.wait())
 
-        while True:
-            # Check for stop request
-            if self._should_stop:
-                self.process.terminate()
-                break
-
-            # Check for pause
-            if self._paused:
-                self._set_status(AgentStatus.PAUSED)
+        try:
+            while True:
+                # Block here while paused; returns immediately otherwise
                 await self._pause_event.wait()
-                if self.status == AgentStatus.PAUSED:
-                    self._set_status(AgentStatus.RUNNING)
 
-            # Check timeout
-            elapsed = time.time() - start_time
-            if elapsed > timeout_seconds:
-                self.process.kill()
-                self.error = f"Timed out after {timeout_seconds/60:.0f} minutes"
-                self._set_status(AgentStatus.FAILED)
-                break
+                # Check for stop request
+                if self._stop_event.is_set():
+                    if self.process.returncode is None:
+                        self.process.terminate()
+                    break
 
-            # Read chunks and process complete lines
-            try:
-                chunk = await asyncio.wait_for(
-                    self.process.stdout.read(65536),  # Read up to 64KB at a time
-                    timeout=0.5,
+                read_task = asyncio.ensure_future(stdout.readuntil(b"\n"))
+                done, _ = await asyncio.wait(
+                    {read_task, stop_task, exit_task},
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
-                if chunk:
-                    buffer += chunk
-                    # Process complete lines
-                    while b"\n" in buffer:
-                        line, buffer = buffer.split(b"\n", 1)
-                        await self._process_output(line.decode("utf-8", errors="replace"))
-                elif self.process.returncode is not None:
-                    # Process finished - handle remaining buffer
-                    if buffer:
-                        await self._process_output(buffer.decode("utf-8", errors="replace"))
-                    # Log exit code for debugging
-                    exit_code = self.process.returncode
-                    line_type = "error" if exit_code != 0 else "text"
-                    self._add_output(OutputLine(
-                        timestamp=datetime.now(),
-                        content=f"[debug] Process exited with code {exit_code}",
-                        line_type=line_type,
-                    ))
+                if read_task not in done and exit_task in done:
+                    # Process exited - drain what it already wrote
+                    done, _ = await asyncio.wait({read_task}, timeout=EXIT_DRAIN_SECONDS)
+                if read_task not in done:
+                    read_task.cancel()
+                    if self._stop_event.is_set():
+                        continue
+                    self._add_exit_output()
                     break
-            except asyncio.TimeoutError:
-                # Check if process is still running
-                if self.process.returncode is not None:
-                    # Process remaining buffer
-                    if buffer:
-                        await self._process_output(buffer.decode("utf-8", errors="replace"))
-                    # Log exit code for debugging
-                    exit_code = self.process.returncode
-                    line_type = "error" if exit_code != 0 else "text"
+
+                try:
+                    line = read_task.result()
+                except asyncio.IncompleteReadError as e:
+                    # EOF - handle any trailing unterminated line
+                    if e.partial:
+                        await self._process_line(e.partial)
+                    # Not process.wait(): it also waits for pipes that a
+                    # grandchild may hold open after the process has exited
+                    await asyncio.wait(
+                        {exit_task, stop_task},
+                        timeout=EXIT_DRAIN_SECONDS,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if self._stop_event.is_set() and self.process.returncode is None:
+                        self.process.terminate()
+                    self._add_exit_output()
+                    break
+                except asyncio.LimitOverrunError as e:
+                    dropped = await self._discard_line(e.consumed)
                     self._add_output(OutputLine(
-                        timestamp=datetime.now(),
-                        content=f"[debug] Process exited with code {exit_code}",
-                        line_type=line_type,
+                        content=f"[stream] Dropped oversized output line ({dropped} bytes)",
+                        line_type="error",
                     ))
-                    break
-                continue
+                    continue
 
-    async def _process_output(self, output: str) -> None:
-        """Process raw output and emit structured events."""
-        for line in output.strip().split("\n"):
-            if not line:
-                continue
+                await self._process_line(line)
+        finally:
+            self._flush_delta()
+            stop_task.cancel()
+            exit_task.cancel()
+
+    async def _discard_line(self, consumed: int) -> int:
+        """Skip past a line longer than the stream limit, returning its size."""
+        stdout = self.process.stdout
+        dropped = 0
+        while True:
+            try:
+                dropped += len(await stdout.readuntil(b"\n"))
+                return dropped
+            except asyncio.LimitOverrunError as e:
+                dropped += len(await stdout.read(e.consumed or consumed))
+            except asyncio.IncompleteReadError as e:
+                return dropped + len(e.partial)
+
+    def _add_exit_output(self) -> None:
+        """Log the subprocess exit code for debugging."""
+        self._flush_delta()
+        exit_code = self.process.returncode
+        self._add_output(OutputLine(
+            content=f"[debug] Process exited with code {exit_code}",
+            line_type="error" if exit_code != 0 else "text",
+        ))
 
+    async def _process_line(self, line: bytes) -> None:
+        """Parse one line of subprocess output and emit structured events."""
+        # Events are always JSON objects; skip the parse attempt (and the
+        # exception it would raise) for plain diagnostic text. orjson accepts
+        # the trailing newline, so event lines are parsed without copying.
+        if line[:1] == b"{":
             try:
-                event = json.loads(line)
+                event = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                event = None
+            if event is not None:
                 await self._handle_event(event)
-            except json.JSONDecodeError:
-                # Not JSON, emit as raw text
-                self._add_output(OutputLine(
-                    timestamp=datetime.now(),
-                    content=line,
-                    line_type="text",
-                ))
-
-    async def _handle_event(self, event: dict[str, Any]) -> None:
-        """Handle a parsed JSON event from Claude."""
-        event_type = event.get("type", "")
+                return
 
-        # Capture model from system init event
-        if event_type == "system" and event.get("subtype") == "init":
-            model = event.get("model", "")
-            if model:
-                self.model = model
+        # Not JSON, emit as raw text
+        text = line.decode("utf-8", errors="replace").strip()
+        if not text:
             return
+        self._flush_delta()
+        self._add_output(OutputLine(
+            content=text,
+            line_type="text",
+        ))
 
-        if event_type == "assistant":
-            message = event.get("message", {})
-            for content in message.get("content", []):
-                content_type = content.get("type", "")
+    def _add_delta(self, line_type: str, text: str) -> None:
+        """Queue a streamed delta, merging it with pending deltas of the same type."""
+        if self._delta_type != line_type:
+            self._flush_delta()
+            self._delta_type = line_type
+            self._delta_flush_handle = asyncio.get_running_loop().call_later(
+                DELTA_FLUSH_SECONDS, self._flush_delta,
+            )
+        self._delta_chunks.append(text)
 
-                if content_type == "thinking":
-                    thinking = content.get("thinking", "")
-                    if thinking:
-                        self._add_output(OutputLine(
-                            timestamp=datetime.now(),
-                            content=thinking,
-                            line_type="thinking",
-                        ))
+    def _flush_delta(self) -> None:
+        """Emit pending delta text as a single output line."""
+        if self._delta_type is None:
+            return
+        if self._delta_flush_handle:
+            self._delta_flush_handle.cancel()
+            self._delta_flush_handle = None
+        self._add_output(OutputLine(
+            content="".join(self._delta_chunks),
+            line_type=self._delta_type,
+        ))
+        self._delta_type = None
+        self._delta_chunks.clear()
 
-                elif content_type == "text":
-                    text = content.get("text", "")
-                    if text:
-                        self._add_output(OutputLine(
-                            timestamp=datetime.now(),
-                            content=text,
-                            line_type="text",
-                        ))
+    async def _handle_event(self, event: dict[str, Any]) -> None:
+        """Handle a parsed JSON event from Claude."""
+        event_type = event.get("type", "")
+        if event_type != "content_block_delta":
+            self._flush_delta()
 
-                elif content_type == "tool_use":
-                    tool_name = content.get("name", "unknown")
-                    tool_input = content.get("input", {})
+        handler = self._EVENT_HANDLERS.get(event_type)
+        if handler:
+            handler(self, event)
 
-                    self._add_tool_use(ToolUse(
-                        tool_name=tool_name,
-                        tool_input=tool_input,
-                        timestamp=datetime.now(),
+    def _handle_system(self, event: dict[str, Any]) -> None:
+        """Capture model from system init event."""
+        if event.get("subtype") == "init":
+            model = event.get("model", "")
+            if model:
+                self._set_model(model)
+
+    def _handle_assistant(self, event: dict[str, Any]) -> None:
+        """Emit the thinking, text and tool_use blocks of an assistant message."""
+        message = event.get("message", {})
+        lines: list[OutputLine] = []
+        for content in message.get("content", []):
+            content_type = content.get("type", "")
+
+            text_key = _CONTENT_TEXT_KEYS.get(content_type)
+            if text_key:
+                text = content.get(text_key, "")
+                if text:
+                    lines.append(OutputLine(
+                        content=text,
+                        line_type=content_type,
                     ))
 
-                    # Also add to output stream
-                    self._add_output(OutputLine(
-                        timestamp=datetime.now(),
-                        content=f"Using tool: {tool_name}",
-                        line_type="tool_use",
-                        metadata={"tool": tool_name, "input": tool_input},
-                    ))
+            elif content_type == "tool_use":
+                tool_name = content.get("name", "unknown")
+                tool_input = content.get("input", {})
 
-        elif event_type == "content_block_delta":
-            delta = event.get("delta", {})
-            delta_type = delta.get("type", "")
+                self._add_tool_use(ToolUse(
+                    tool_name=tool_name,
+                    tool_input=tool_input,
+                ))
 
-            if delta_type == "thinking_delta":
-                thinking = delta.get("thinking", "")
-                if thinking:
-                    self._add_output(OutputLine(
-                        timestamp=datetime.now(),
-                        content=thinking,
-                        line_type="thinking_delta",
-                    ))
+                # Also add to output stream
+                lines.append(OutputLine(
+                    content=f"Using tool: {tool_name}",
+                    line_type="tool_use",
+                    metadata={"tool": tool_name, "input": tool_input},
+                ))
 
-            elif delta_type == "text_delta":
-                text = delta.get("text", "")
-                if text:
-                    self._add_output(OutputLine(
-                        timestamp=datetime.now(),
-                        content=text,
-                        line_type="text_delta",
-                    ))
+        if lines:
+            self._add_outputs(lines)
+
+    def _handle_delta(self, event: dict[str, Any]) -> None:
+        """Queue a streamed thinking/text delta."""
+        delta = event.get("delta", {})
+        delta_type = delta.get("type", "")
+        text_key = _DELTA_TEXT_KEYS.get(delta_type)
+        if text_key:
+            text = delta.get(text_key, "")
+            if text:
+                self._add_delta(delta_type, text)
+
+    def _handle_result(self, event: dict[str, Any]) -> None:
+        """Emit the final result and capture usage and model info."""
+        result = event.get("result", "")
+        if result:
+            self._add_output(OutputLine(
+                content=result,
+                line_type="result",
+            ))
 
-        elif event_type == "result":
-            result = event.get("result", "")
-            if result:
-                self._add_output(OutputLine(
-                    timestamp=datetime.now(),
-                    content=result,
-                    line_type="result",
-                ))
+        # Capture usage metrics from result
+        usage = event.get("usage", {})
+        if usage:
+            self._update_usage(usage)
 
-            # Capture usage metrics from result
-            usage = event.get("usage", {})
-            if usage:
-                self._update_usage(usage)
+        # Capture model info
+        model = event.get("model", "")
+        if model:
+            self._set_model(model)
 
-            # Capture model info
-            model = event.get("model", "")
-            if model:
-                self.model = model
+    _EVENT_HANDLERS: dict[str, Callable[[Agent, dict[str, Any]], None]] = {
+        "system": _handle_system,
+        "assistant": _handle_assistant,
+        "content_block_delta": _handle_delta,
+        "result": _handle_result,
+    }
 
     def pause(self) -> None:
         """Pause the agent."""
-        self._paused = True
         self._pause_event.clear()
+        if self.status == AgentStatus.RUNNING:
+            self._set_status(AgentStatus.PAUSED)
 
     def resume(self) -> None:
         """Resume the agent."""
-        self._paused = False
         self._pause_event.set()
+        if self.status == AgentStatus.PAUSED:
+            self._set_status(AgentStatus.RUNNING)
 
     async def stop(self) -> None:
         """Stop the agent gracefully."""
-        self._should_stop = True
+        self._stop_event.set()
         self._set_status(AgentStatus.STOPPING)
 
-        if self._paused:
+        if not self._pause_event.is_set():
             self.resume()  # Unpause so it can stop
 
         # Wait for process to finish
@@ -623,7 +919,7 @@ class Agent:
 
     async def kill(self) -> None:
         """Kill the agent immediately."""
-        self._should_stop = True
+        self._stop_event.set()
 
         if self.process:
             try:
@@ -634,35 +930,73 @@ class Agent:
 
         self._set_status(AgentStatus.STOPPED)
 
-    def get_output(self, limit: int | None = None, offset: int = 0) -> list[OutputLine]:
-        """Get output buffer contents."""
-        output = list(self.output_buffer)
-        if offset:
-            output = output[offset:]
-        if limit:
-            output = output[:limit]
-        return output
+    def get_output(
+        self,
+        limit: int | None = None,
+        offset: int = 0,
+        tail: int | None = None,
+    ) -> list[OutputLine]:
+        """Get output buffer contents.
+
+        Slices the buffer in place rather than copying all of it first. Pass
+        ``tail`` to get the most recent lines, which only walks that many.
+        """
+        buffer = self.output_buffer
+        if tail is not None:
+            lines = list(islice(reversed(buffer), tail))
+            lines.reverse()
+            return lines
+        if offset < 0:
+            offset = max(len(buffer) + offset, 0)
+        return list(islice(buffer, offset, offset + limit if limit else None))
+
+    def get_output_since(self, seq: int, limit: int | None = None) -> list[OutputLine]:
+        """Get the lines added since ``output_seq`` was ``seq``.
+
+        Lines that have already left the buffer are skipped. With ``limit``,
+        only the newest ``limit`` of the new lines are returned.
+        """
+        buffer = self.output_buffer
+        if seq > self.output_seq:
+            seq = 0  # Cursor from an earlier agent with this ID
+        count = min(self.output_seq - seq, len(buffer))
+        if limit is not None:
+            count = min(count, limit)
+        if count <= 0:
+            return []
+        lines = list(islice(reversed(buffer), count))
+        lines.reverse()
+        return lines
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert agent state to dictionary."""
-        result = {
-            "id": self.id,
-            "type": self.type.value,
-            "status": self.status.value,
-            "currentTask": self.current_task,
-            "goal": self.goal,
-            "startedAt": self.started_at.isoformat() if self.started_at else None,
-            "finishedAt": self.finished_at.isoformat() if self.finished_at else None,
-            "filesModified": self.files_modified,
-            "toolsUsed": len(self.tools_used),
+        """Convert agent state to dictionary.
+
+        Everything except the output and tool counters is cached until one of
+        the serialised attributes changes, so repeated status polls of an
+        unchanged agent skip the isoformat and usage conversions.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = {
+                "id": self.id,
+                "type": self.type.value,
+                "status": self.status.value,
+                "currentTask": self.current_task,
+                "goal": self.goal,
+                "startedAt": self.started_at.isoformat() if self.started_at else None,
+                "finishedAt": self.finished_at.isoformat() if self.finished_at else None,
+                "filesModified": list(self.files_modified),
+                "error": self.error,
+                # Usage metrics
+                "usage": self.usage_metrics.to_dict(),
+                "model": self.model,
+                # Relationship tracking
+                "assignedBy": self.assigned_by,
+                "delegatedTo": list(self.delegated_to),
+                "waitingFor": self.waiting_for,
+            }
+        return {
+            **snapshot,
+            "toolsUsed": self.tool_use_count,
             "outputLines": len(self.output_buffer),
-            "error": self.error,
-            # Usage metrics
-            "usage": self.usage_metrics.to_dict(),
-            "model": self.model,
-            # Relationship tracking
-            "assignedBy": self.assigned_by,
-            "delegatedTo": self.delegated_to,
-            "waitingFor": self.waiting_for,
         }
-        return result
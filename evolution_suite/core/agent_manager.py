@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Iterator
 from dataclasses import dataclass, field
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+from functools import lru_cache, partial
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 
 from evolution_suite.core.agent import (
@@ -20,7 +26,11 @@ if TYPE_CHECKING:
     from evolution_suite.core.config import Config
 
 
-@dataclass
+class DuplicateAgentError(ValueError):
+    """Raised when spawning an agent under an ID that is already in use."""
+
+
+@dataclass(slots=True)
 class AgentRelationship:
     """Represents a relationship between two agents."""
 
@@ -40,14 +50,18 @@ class AgentRelationship:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyUsage:
     """Aggregated usage for a single day."""
 
     date: date
     metrics: UsageMetrics = field(default_factory=UsageMetrics)
-    by_agent_type: dict[str, UsageMetrics] = field(default_factory=dict)
-    by_model: dict[str, UsageMetrics] = field(default_factory=dict)
+    by_agent_type: defaultdict[str, UsageMetrics] = field(
+        default_factory=lambda: defaultdict(UsageMetrics)
+    )
+    by_model: defaultdict[str, UsageMetrics] = field(
+        default_factory=lambda: defaultdict(UsageMetrics)
+    )
     cycles: int = 0
     successful_cycles: int = 0
 
@@ -61,6 +75,31 @@ class DailyUsage:
             "successRate": (self.successful_cycles / self.cycles * 100) if self.cycles > 0 else 0,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DailyUsage:
+        """Rebuild a day from its archived form (to_dict() plus successfulCycles)."""
+        return cls(
+            date=date.fromisoformat(data["date"]),
+            metrics=UsageMetrics.from_dict(data["metrics"]),
+            by_agent_type=defaultdict(UsageMetrics, {
+                k: UsageMetrics.from_dict(v) for k, v in data.get("byAgentType", {}).items()
+            }),
+            by_model=defaultdict(UsageMetrics, {
+                k: UsageMetrics.from_dict(v) for k, v in data.get("byModel", {}).items()
+            }),
+            cycles=data.get("cycles", 0),
+            successful_cycles=data.get("successfulCycles", 0),
+        )
+
+
+@lru_cache(maxsize=128)
+def _load_daily_usage(path: Path) -> DailyUsage | None:
+    """Load an archived day, or None if it was never archived."""
+    try:
+        return DailyUsage.from_dict(json.loads(path.read_text()))
+    except (OSError, ValueError, KeyError):
+        return None
+
 
 class AgentManager:
     """Manages pool of agents, lifecycle, and communication."""
@@ -75,87 +114,158 @@ class AgentManager:
         self._on_event = on_event
         self._lock = asyncio.Lock()
 
+        # Agents partitioned by type, mirroring self.agents
+        self._by_type: dict[AgentType, dict[str, Agent]] = {t: {} for t in AgentType}
+        # Idle agent IDs per type, oldest first (dicts used as ordered sets)
+        self._idle_by_type: dict[AgentType, dict[str, None]] = {t: {} for t in AgentType}
+        self._running: set[str] = set()  # IDs of agents currently RUNNING
+
+        # Strong references to agent run tasks; the loop only keeps weak ones
+        self._tasks: set[asyncio.Task] = set()
+
         # Relationship tracking
         self.relationships: list[AgentRelationship] = []
+        # Non-completed relationships keyed by id(), and open 'waiting' ones per source agent
+        self._active_relationships: dict[int, AgentRelationship] = {}
+        self._waiting_by_source: dict[str, list[AgentRelationship]] = {}
 
         # Usage tracking
         self.total_usage = UsageMetrics()
         self.daily_usage: dict[date, DailyUsage] = {}
+        self._usage_batch: dict[str, UsageMetrics] = {}  # Unsent usage deltas per agent
+        self._usage_flush_handle: asyncio.TimerHandle | None = None
+        self._today = date.min
+        self._today_ends_at = 0.0  # Epoch seconds of the next local midnight
+
+    def _current_date(self) -> date:
+        """Return today's date, only asking the clock for it after midnight."""
+        if time.time() >= self._today_ends_at:
+            today = date.today()
+            if today != self._today:
+                self._archive_past_usage(today)
+            self._today = today
+            tomorrow = datetime.combine(self._today + timedelta(days=1), datetime.min.time())
+            self._today_ends_at = tomorrow.timestamp()
+        return self._today
+
+    def _archive_past_usage(self, today: date) -> None:
+        """Move finished days from memory to the usage archive on disk."""
+        past_days = [d for d in self.daily_usage if d < today]
+        if not past_days:
+            return
+
+        usage_dir = self.config.get_usage_dir()
+        try:
+            usage_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return
+
+        for d in past_days:
+            daily = self.daily_usage[d]
+            try:
+                (usage_dir / f"{d.isoformat()}.json").write_text(json.dumps({
+                    **daily.to_dict(),
+                    "successfulCycles": daily.successful_cycles,
+                }))
+            except OSError:
+                continue  # Keep it in memory rather than lose it
+            del self.daily_usage[d]
+        _load_daily_usage.cache_clear()
 
     def _emit_event(self, event_type: str, **data: Any) -> None:
         """Emit an event to listeners."""
         if self._on_event:
-            self._on_event({
-                "type": event_type,
-                "timestamp": datetime.now().isoformat(),
-                **data,
-            })
-
-    def _make_output_callback(self, agent_id: str) -> Callable[[OutputLine], None]:
-        """Create output callback for an agent."""
-        def callback(line: OutputLine) -> None:
-            self._emit_event(
-                "agent_output",
-                agentId=agent_id,
-                line=line.to_dict(),
-            )
-        return callback
+            # The kwargs dict is already a fresh dict; fill it in rather than copy it
+            data["type"] = event_type
+            data["timestamp"] = datetime.now().isoformat()
+            self._on_event(data)
 
-    def _make_tool_callback(self, agent_id: str) -> Callable[[ToolUse], None]:
-        """Create tool use callback for an agent."""
-        def callback(tool: ToolUse) -> None:
-            self._emit_event(
-                "agent_tool_use",
-                agentId=agent_id,
-                tool=tool.to_dict(),
-            )
-        return callback
+    # Agent callbacks; spawn_agent binds the agent ID with functools.partial
 
-    def _make_status_callback(self, agent_id: str) -> Callable[[AgentStatus], None]:
-        """Create status change callback for an agent."""
-        def callback(status: AgentStatus) -> None:
-            self._emit_event(
-                "agent_status",
-                agentId=agent_id,
-                status=status.value,
+    def _on_agent_output(self, agent_id: str, line: OutputLine) -> None:
+        """Forward a single output line from an agent."""
+        self._emit_event(
+            "agent_output",
+            agentId=agent_id,
+            line=line.to_dict(),
+        )
+
+    def _on_agent_output_batch(self, agent_id: str, lines: list[OutputLine]) -> None:
+        """Forward a batch of output lines from an agent."""
+        self._emit_event(
+            "agent_output_batch",
+            agentId=agent_id,
+            lines=[line.to_dict() for line in lines],
+        )
+
+    def _on_agent_tool_use(self, agent_id: str, tool: ToolUse) -> None:
+        """Forward a tool use from an agent."""
+        self._emit_event(
+            "agent_tool_use",
+            agentId=agent_id,
+            tool=tool.to_dict(),
+        )
+
+    def _on_agent_status(self, agent_id: str, status: AgentStatus) -> None:
+        """Update the pool indexes for an agent's status change and forward it."""
+        agent = self.agents.get(agent_id)
+        if agent:
+            idle = self._idle_by_type[agent.type]
+            if status == AgentStatus.IDLE:
+                idle[agent_id] = None
+            else:
+                idle.pop(agent_id, None)
+
+            if status == AgentStatus.RUNNING:
+                self._running.add(agent_id)
+            else:
+                self._running.discard(agent_id)
+
+        self._emit_event(
+            "agent_status",
+            agentId=agent_id,
+            status=status.value,
+        )
+
+    def _on_agent_usage(self, agent_id: str, metrics: UsageMetrics) -> None:
+        """Aggregate an agent's usage and queue it for the next usage_update."""
+        agent = self.agents.get(agent_id)
+        if agent:
+            # Update daily aggregates
+            daily = self.get_today_usage()
+            daily.metrics.add(metrics)
+            daily.by_agent_type[agent.type.value].add(metrics)
+            daily.by_model[agent.model].add(metrics)
+
+            # Update total
+            self.total_usage.add(metrics)
+
+        # Coalesce per agent; the aggregates above are already exact
+        pending = self._usage_batch.get(agent_id)
+        if pending is None:
+            pending = self._usage_batch[agent_id] = UsageMetrics()
+        pending.add(metrics)
+
+        if len(self._usage_batch) >= self.config.server.usage_batch_max:
+            self._flush_usage()
+        elif self._usage_flush_handle is None:
+            self._usage_flush_handle = asyncio.get_running_loop().call_later(
+                self.config.server.usage_flush_seconds, self._flush_usage,
             )
-        return callback
 
-    def _make_usage_callback(self, agent_id: str) -> Callable[[UsageMetrics], None]:
-        """Create usage callback for an agent."""
-        def callback(metrics: UsageMetrics) -> None:
-            agent = self.agents.get(agent_id)
-            if agent:
-                # Update daily aggregates
-                today = date.today()
-                if today not in self.daily_usage:
-                    self.daily_usage[today] = DailyUsage(date=today)
-
-                daily = self.daily_usage[today]
-                daily.metrics.add(metrics)
-
-                # By agent type
-                agent_type = agent.type.value
-                if agent_type not in daily.by_agent_type:
-                    daily.by_agent_type[agent_type] = UsageMetrics()
-                daily.by_agent_type[agent_type].add(metrics)
-
-                # By model
-                model = agent.model
-                if model not in daily.by_model:
-                    daily.by_model[model] = UsageMetrics()
-                daily.by_model[model].add(metrics)
-
-                # Update total
-                self.total_usage.add(metrics)
-
-            # Emit event
+    def _flush_usage(self) -> None:
+        """Emit one usage_update per agent with its usage since the last flush."""
+        if self._usage_flush_handle is not None:
+            self._usage_flush_handle.cancel()
+            self._usage_flush_handle = None
+
+        batch, self._usage_batch = self._usage_batch, {}
+        for agent_id, metrics in batch.items():
             self._emit_event(
                 "usage_update",
                 agentId=agent_id,
                 metrics=metrics.to_dict(),
             )
-        return callback
 
     async def spawn_agent(
         self,
@@ -163,39 +273,50 @@ class AgentManager:
         agent_id: str | None = None,
         assigned_by: str | None = None,
     ) -> Agent:
-        """Spawn a new agent of the given type."""
-        async with self._lock:
-            agent = Agent(
-                agent_type=agent_type,
-                config=self.config,
-                agent_id=agent_id,
-                on_output=self._make_output_callback(agent_id or ""),
-                on_tool_use=self._make_tool_callback(agent_id or ""),
-                on_status_change=self._make_status_callback(agent_id or ""),
-                on_usage=self._make_usage_callback(agent_id or ""),
-            )
+        """Spawn a new agent of the given type.
+
+        Raises DuplicateAgentError if ``agent_id`` belongs to an existing agent.
+        """
+        agent = Agent(
+            agent_type=agent_type,
+            config=self.config,
+            agent_id=agent_id,
+        )
+
+        # Callbacks need the final ID, which Agent generates when none is given
+        agent.set_callbacks(
+            on_output=partial(self._on_agent_output, agent.id),
+            on_tool_use=partial(self._on_agent_tool_use, agent.id),
+            on_status_change=partial(self._on_agent_status, agent.id),
+            on_usage=partial(self._on_agent_usage, agent.id),
+            on_output_batch=partial(self._on_agent_output_batch, agent.id),
+        )
+        if assigned_by:
+            agent.assigned_by = assigned_by
 
-            # Update callbacks with actual ID
-            agent._on_output = self._make_output_callback(agent.id)
-            agent._on_tool_use = self._make_tool_callback(agent.id)
-            agent._on_status_change = self._make_status_callback(agent.id)
-            agent._on_usage = self._make_usage_callback(agent.id)
+        # Only the shared pool bookkeeping needs the lock
+        async with self._lock:
+            # Replacing a live agent would orphan its process and let its
+            # status callbacks update the pools under the new agent's ID
+            if agent.id in self.agents:
+                raise DuplicateAgentError(f"Agent already exists: {agent.id}")
 
             # Set relationship if assigned by another agent
             if assigned_by:
-                agent.assigned_by = assigned_by
                 assigner = self.agents.get(assigned_by)
                 if assigner:
-                    assigner.delegated_to.append(agent.id)
+                    assigner.add_delegation(agent.id)
 
             self.agents[agent.id] = agent
+            self._by_type[agent.type][agent.id] = agent
+            self._idle_by_type[agent.type][agent.id] = None
 
-            self._emit_event(
-                "agent_spawned",
-                agent=agent.to_dict(),
-            )
+        self._emit_event(
+            "agent_spawned",
+            agent=agent.to_dict(),
+        )
 
-            return agent
+        return agent
 
     async def start_agent(self, agent_id: str, prompt: str) -> None:
         """Start an agent with a prompt."""
@@ -204,7 +325,22 @@ class AgentManager:
             raise ValueError(f"Agent not found: {agent_id}")
 
         # Run in background
-        asyncio.create_task(agent.start(prompt))
+        task = asyncio.create_task(agent.start(prompt), name=f"agent-{agent_id}")
+        self._tasks.add(task)
+        task.add_done_callback(partial(self._on_agent_task_done, agent_id))
+
+    def _on_agent_task_done(self, agent_id: str, task: asyncio.Task) -> None:
+        """Release a finished agent run task and report its failure."""
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._emit_event(
+                "agent_error",
+                agentId=agent_id,
+                error=str(error),
+            )
 
     async def get_agent(self, agent_id: str) -> Agent | None:
         """Get an agent by ID."""
@@ -212,10 +348,9 @@ class AgentManager:
 
     async def list_agents(self, agent_type: AgentType | None = None) -> list[Agent]:
         """List all agents, optionally filtered by type."""
-        agents = list(self.agents.values())
         if agent_type:
-            agents = [a for a in agents if a.type == agent_type]
-        return agents
+            return list(self._by_type[agent_type].values())
+        return list(self.agents.values())
 
     async def inject_guidance(self, agent_id: str, content: str) -> None:
         """Inject guidance into an agent."""
@@ -264,7 +399,12 @@ class AgentManager:
         await agent.kill()
 
         async with self._lock:
-            del self.agents[agent_id]
+            # A concurrent kill of the same agent may have removed it already
+            if self.agents.pop(agent_id, None) is None:
+                return
+            self._by_type[agent.type].pop(agent_id, None)
+            self._idle_by_type[agent.type].pop(agent_id, None)
+            self._running.discard(agent_id)
 
         self._emit_event(
             "agent_killed",
@@ -273,9 +413,9 @@ class AgentManager:
 
     async def get_idle_agent(self, agent_type: AgentType) -> Agent | None:
         """Get an idle agent of the given type, or None if none available."""
-        for agent in self.agents.values():
-            if agent.type == agent_type and agent.status == AgentStatus.IDLE:
-                return agent
+        idle = self._idle_by_type[agent_type]
+        if idle:
+            return self.agents[next(iter(idle))]
         return None
 
     async def get_or_spawn_agent(self, agent_type: AgentType) -> Agent:
@@ -287,33 +427,35 @@ class AgentManager:
 
     async def stop_all(self) -> None:
         """Stop all agents."""
-        tasks = [self.stop_agent(agent_id) for agent_id in list(self.agents.keys())]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._for_each_agent(self.stop_agent)
 
     async def kill_all(self) -> None:
         """Kill all agents immediately."""
-        tasks = [self.kill_agent(agent_id) for agent_id in list(self.agents.keys())]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._for_each_agent(self.kill_agent)
+
+    async def _for_each_agent(self, action: Callable[[str], Awaitable[None]]) -> None:
+        """Apply an agent action to the whole pool with bounded concurrency."""
+        sem = asyncio.Semaphore(self.config.server.shutdown_concurrency)
+
+        async def bounded(agent_id: str) -> None:
+            async with sem:
+                await action(agent_id)
+
+        await asyncio.gather(
+            *(bounded(agent_id) for agent_id in tuple(self.agents)),
+            return_exceptions=True,
+        )
 
     def get_status(self) -> dict[str, Any]:
         """Get overall status of the agent pool."""
         agents_by_type: dict[str, list[dict]] = {
-            "coordinator": [],
-            "worker": [],
-            "evaluator": [],
+            agent_type.value: [agent.to_dict() for agent in agents.values()]
+            for agent_type, agents in self._by_type.items()
         }
 
-        for agent in self.agents.values():
-            agents_by_type[agent.type.value].append(agent.to_dict())
-
-        running_count = sum(
-            1 for a in self.agents.values()
-            if a.status == AgentStatus.RUNNING
-        )
-
         return {
             "totalAgents": len(self.agents),
-            "runningAgents": running_count,
+            "runningAgents": len(self._running),
             "agents": agents_by_type,
             "relationships": [r.to_dict() for r in self.relationships],
             "totalUsage": self.total_usage.to_dict(),
@@ -336,9 +478,12 @@ class AgentManager:
             task_description=task_description,
         )
         self.relationships.append(relationship)
+        if relationship_type != "completed":
+            self._active_relationships[id(relationship)] = relationship
 
         # Update agent waiting_for if this is a waiting relationship
         if relationship_type == "waiting":
+            self._waiting_by_source.setdefault(source_id, []).append(relationship)
             agent = self.agents.get(source_id)
             if agent:
                 agent.waiting_for = target_id
@@ -357,45 +502,48 @@ class AgentManager:
             agent.waiting_for = None
 
         # Update relationship to completed
-        for rel in self.relationships:
-            if rel.source_id == agent_id and rel.relationship_type == "waiting":
-                rel.relationship_type = "completed"
-                self._emit_event(
-                    "relationship_changed",
-                    relationship=rel.to_dict(),
-                )
+        for rel in self._waiting_by_source.pop(agent_id, ()):
+            rel.relationship_type = "completed"
+            del self._active_relationships[id(rel)]
+            self._emit_event(
+                "relationship_changed",
+                relationship=rel.to_dict(),
+            )
 
     def get_active_relationships(self) -> list[AgentRelationship]:
         """Get all active (non-completed) relationships."""
-        return [r for r in self.relationships if r.relationship_type != "completed"]
+        return list(self._active_relationships.values())
 
     # Usage reporting
 
     def get_today_usage(self) -> DailyUsage:
         """Get today's usage statistics."""
-        today = date.today()
-        if today not in self.daily_usage:
-            self.daily_usage[today] = DailyUsage(date=today)
-        return self.daily_usage[today]
+        today = self._current_date()
+        daily = self.daily_usage.get(today)
+        if daily is None:
+            daily = self.daily_usage[today] = DailyUsage(date=today)
+        return daily
+
+    def iter_usage_history(self, days: int = 7) -> Iterator[DailyUsage]:
+        """Yield usage for the past N days, newest first, loading each day on demand."""
+        today = self._current_date()
+        usage_dir = self.config.get_usage_dir()
+        one_day = timedelta(days=1)
+        d = today
+        for _ in range(days):
+            daily = self.daily_usage.get(d)
+            if daily is None and d < today:
+                daily = _load_daily_usage(usage_dir / f"{d.isoformat()}.json")
+            yield daily or DailyUsage(date=d)
+            d -= one_day
 
     def get_usage_history(self, days: int = 7) -> list[DailyUsage]:
         """Get usage history for the past N days."""
-        today = date.today()
-        result = []
-        for i in range(days):
-            d = date(today.year, today.month, today.day)
-            d = date.fromordinal(d.toordinal() - i)
-            if d in self.daily_usage:
-                result.append(self.daily_usage[d])
-            else:
-                result.append(DailyUsage(date=d))
-        return result
+        return list(self.iter_usage_history(days))
 
     def record_cycle(self, success: bool) -> None:
         """Record a completed cycle for today's statistics."""
-        today = date.today()
-        if today not in self.daily_usage:
-            self.daily_usage[today] = DailyUsage(date=today)
-        self.daily_usage[today].cycles += 1
+        daily = self.get_today_usage()
+        daily.cycles += 1
         if success:
-            self.daily_usage[today].successful_cycles += 1
+            daily.successful_cycles += 1
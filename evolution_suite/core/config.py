@@ -4,7 +4,12 @@ from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml bindings
+except ImportError:
+    from yaml import SafeLoader
 
 
 class ProjectConfig(BaseModel):
@@ -42,6 +47,10 @@ class AgentsConfig(BaseModel):
     coordinator: AgentTypeConfig = Field(default_factory=AgentTypeConfig)
     worker: AgentTypeConfig = Field(default_factory=AgentTypeConfig)
     evaluator: AgentTypeConfig = Field(default_factory=AgentTypeConfig)
+    tools_used_max: int = Field(default=5000, ge=1)  # Per-agent cap on retained tool use records
+    launch_rate_per_minute: float = 10.0  # Orchestrator agent runs started per minute; 0 disables
+    # Runs that may start back to back before the rate applies
+    launch_burst: int = Field(default=3, ge=1)
 
 
 class ServerConfig(BaseModel):
@@ -49,6 +58,9 @@ class ServerConfig(BaseModel):
 
     port: int = 8420
     host: str = "127.0.0.1"
+    usage_flush_seconds: float = 0.25  # Max delay before coalesced usage_update events go out
+    usage_batch_max: int = 32  # Flush usage_update events early once this many agents are pending
+    shutdown_concurrency: int = 16  # Max agents stopped/killed at once by stop_all/kill_all
 
 
 class ProtectionConfig(BaseModel):
@@ -81,24 +93,45 @@ class Config(BaseModel):
     project_root: Path = Field(default=Path.cwd(), exclude=True)
     config_path: Path | None = Field(default=None, exclude=True)
 
+    # Resolved state paths, valid while (project_root, state.directory) is unchanged
+    _path_cache: dict[str, Path] = PrivateAttr(default_factory=dict)
+    _path_cache_key: tuple[Path, str] | None = PrivateAttr(default=None)
+
+    def _state_path(self, name: str) -> Path:
+        """Resolve (and cache) a path inside the state directory."""
+        key = (self.project_root, self.state.directory)
+        if key != self._path_cache_key:
+            self._path_cache_key = key
+            self._path_cache = {}
+
+        path = self._path_cache.get(name)
+        if path is None:
+            state_path = Path(self.state.directory)
+            if not state_path.is_absolute():
+                state_path = self.project_root / state_path
+            path = state_path / name if name else state_path
+            self._path_cache[name] = path
+        return path
+
     def get_state_dir(self) -> Path:
         """Get absolute path to state directory."""
-        state_path = Path(self.state.directory)
-        if state_path.is_absolute():
-            return state_path
-        return self.project_root / state_path
+        return self._state_path("")
 
     def get_guidance_dir(self) -> Path:
         """Get path to guidance files directory."""
-        return self.get_state_dir() / ".guidance"
+        return self._state_path(".guidance")
 
     def get_agent_state_dir(self) -> Path:
         """Get path to agent state directory."""
-        return self.get_state_dir() / ".agent-state"
+        return self._state_path(".agent-state")
+
+    def get_usage_dir(self) -> Path:
+        """Get path to archived daily usage directory."""
+        return self._state_path(".usage")
 
     def get_cycle_logs_dir(self) -> Path:
         """Get path to cycle logs directory."""
-        return self.get_state_dir() / "cycle_logs"
+        return self._state_path("cycle_logs")
 
     def get_prompt_path(self, prompt_type: str) -> Path | None:
         """Get path to a prompt template, or None to use default."""
@@ -112,11 +145,11 @@ class Config(BaseModel):
 
     def get_state_file(self) -> Path:
         """Get path to evolution state file."""
-        return self.get_state_dir() / "EVOLUTION_STATE.md"
+        return self._state_path("EVOLUTION_STATE.md")
 
     def get_log_file(self) -> Path:
         """Get path to evolution log file."""
-        return self.get_state_dir() / "EVOLUTION_LOG.md"
+        return self._state_path("EVOLUTION_LOG.md")
 
 
 def load_config(config_path: Path) -> Config:
@@ -124,8 +157,8 @@ def load_config(config_path: Path) -> Config:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path) as f:
-        data: dict[str, Any] = yaml.safe_load(f) or {}
+    with open(config_path, "rb") as f:
+        data: dict[str, Any] = yaml.load(f, Loader=SafeLoader) or {}
 
     config = Config(**data)
     config.project_root = config_path.parent
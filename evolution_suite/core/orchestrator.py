@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
+import os
 import re
-from dataclasses import dataclass
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 
-from evolution_suite.core.agent import AgentStatus, AgentType
+from evolution_suite.core.agent import Agent, AgentStatus, AgentType
 from evolution_suite.core.agent_manager import AgentManager
+from evolution_suite.core.rate_limiter import RateLimiter
 
 if TYPE_CHECKING:
     from evolution_suite.core.config import Config
@@ -37,7 +44,99 @@ class CyclePhase(str, Enum):
     FAILED = "FAILED"
 
 
-@dataclass
+# Coordinator output parsing
+_TASK_PATTERNS = {
+    task_type: re.compile(rf"{task_type.value}:\s*(.+?)(?=\n\n|\Z)", re.DOTALL)
+    for task_type in TaskType
+}
+_TASK_MARKER_RE = re.compile("(" + "|".join(t.value for t in TaskType) + "):")
+_TASK_XML_RE = re.compile(r"<task>.*?</task>", re.DOTALL)
+_FILES_RE = re.compile(r"<files>(.*?)</files>", re.DOTALL)
+_SKILLS_RE = re.compile(r"<skills>(.*?)</skills>", re.DOTALL)
+_FILE_ENTRY_RE = re.compile(r"\S(?:[^\n]*\S)?")  # Non-blank lines, stripped
+_SKILL_ENTRY_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")  # Non-blank comma items, stripped
+
+# Log and state file maintenance
+_CYCLE_MARKER_RE = re.compile(rb"## Cycle \d+:")
+_LOG_RESCAN_BYTES = 64  # Re-read this much of the old log end, in case a marker was cut off
+_STATE_CYCLE_RE = re.compile(r"\*\*Cycle\*\*: \d+")
+_STATE_UPDATED_RE = re.compile(r"\*\*Last Updated\*\*: .*")
+
+# Agent errors that indicate the model API is throttling us
+_RATE_LIMIT_RE = re.compile(r"rate.?limit|\b429\b|overloaded", re.IGNORECASE)
+
+# Cycle results retained in memory for status and the cycles API
+CYCLES_HISTORY_MAX = 100
+
+# Prompt input files kept in memory; the least recently used is evicted first
+_FILE_CACHE_MAX = 32
+
+# {{NAME}} placeholders in prompt templates
+_PLACEHOLDER_RE = re.compile(r"\{\{([A-Z_]+)\}\}")
+
+# Bundled prompt templates, used when the config names no custom prompt
+_DEFAULT_PROMPTS_DIR = Path(__file__).parent.parent.parent / "templates" / "prompts"
+
+
+def _render_prompt(template: str, values: dict[str, str]) -> str:
+    """Fill {{NAME}} placeholders in one pass; unknown names are left as-is."""
+    return _PLACEHOLDER_RE.sub(lambda m: values.get(m.group(1), m.group(0)), template)
+
+
+def _guidance_block(guidance: str | None) -> str:
+    """Format injected guidance for a prompt, or nothing if there is none."""
+    if guidance:
+        return f"\n## Injected Guidance\n\n{guidance}\n"
+    return ""
+
+
+def _find_guidance(guidance_dir: Path, agent_type: str) -> str | None:
+    """Return the first non-empty <agent_type>*.md file in the guidance directory."""
+    try:
+        entries = os.scandir(guidance_dir)
+    except OSError:
+        return None
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith(agent_type) and name.endswith(".md")):
+                continue
+            try:
+                with open(entry.path) as f:
+                    content = f.read().strip()
+            except OSError:
+                continue  # Removed since the scan, or a directory
+            if content:
+                return content
+    return None
+
+
+@dataclass(slots=True)
+class _LogIndex:
+    """Cycle marker offsets in the evolution log, extended as the log grows."""
+
+    max_entries: int
+    recent: deque[int]  # Offsets of the last max_entries markers
+    scanned: int = 0  # Bytes of the log indexed so far
+    tail: bytes = b""  # Last bytes indexed, to detect a rewritten log
+    first_marker: int | None = None
+    count: int = 0
+
+    def is_current(self, f: Any) -> bool:
+        """Check that the indexed part of the log has not been rewritten."""
+        if self.tail:
+            f.seek(self.scanned - len(self.tail))
+            if f.read(len(self.tail)) != self.tail:
+                return False
+        for offset in (self.first_marker, self.recent[0] if self.recent else None):
+            if offset is not None:
+                f.seek(offset)
+                if not _CYCLE_MARKER_RE.match(f.read(32)):
+                    return False
+        return True
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
 class CoordinatorDecision:
     """Decision from coordinator agent."""
 
@@ -48,9 +147,13 @@ class CoordinatorDecision:
     skills: list[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class CycleResult:
-    """Result of an evolution cycle."""
+    """Result of an evolution cycle.
+
+    Results are immutable, so the serialized form is built once and shared
+    by the cycle events, get_status and the API.
+    """
 
     cycle: int
     task_type: TaskType
@@ -61,9 +164,12 @@ class CycleResult:
     duration_seconds: float
     commit_hash: str | None = None
     error: str | None = None
+    _dict: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        if self._dict is not None:
+            return self._dict
+        data = {
             "cycle": self.cycle,
             "taskType": self.task_type.value,
             "description": self.description,
@@ -74,6 +180,8 @@ class CycleResult:
             "commitHash": self.commit_hash,
             "error": self.error,
         }
+        object.__setattr__(self, "_dict", data)  # Frozen; the cache is the one late field
+        return data
 
 
 class Orchestrator:
@@ -93,21 +201,40 @@ class Orchestrator:
         self.cycle = 0
         self.phase = CyclePhase.IDLE
         self.running = False
-        self.cycles_history: list[CycleResult] = []
+        self.cycles_history: deque[CycleResult] = deque(maxlen=CYCLES_HISTORY_MAX)
+        # Every result is also appended here, so cycles evicted from memory stay queryable
+        self._cycles_file = config.get_cycle_logs_dir() / "cycles.jsonl"
+        self._cycle_offsets: dict[int, int] = {}  # Cycle -> offset of its newest record
+        self._cycles_indexed = 0  # Bytes of the record file indexed so far
+        self._cycles_lock = asyncio.Lock()
 
         self._stop_requested = False
 
+        # Admission control for the coordinator and worker runs of each cycle
+        launch_rate = config.agents.launch_rate_per_minute
+        self._rate_limiter = (
+            RateLimiter(launch_rate / 60, config.agents.launch_burst) if launch_rate > 0 else None
+        )
+
+        self._project_file = config.get_state_dir() / "EVOLUTION_PROJECT.md"
+
+        self._log_index: _LogIndex | None = None
+
+        # Prompt inputs by path, with the (mtime_ns, size) they were read at; in LRU order
+        self._file_cache: dict[Path, tuple[tuple[int, int], str]] = {}
+
     def _emit_event(self, event_type: str, **data: Any) -> None:
         """Emit an event to listeners."""
         if self._on_event:
-            self._on_event({
-                "type": event_type,
-                "timestamp": datetime.now().isoformat(),
-                **data,
-            })
+            # The kwargs dict is already a fresh dict; fill it in rather than copy it
+            data["type"] = event_type
+            data["timestamp"] = datetime.now().isoformat()
+            self._on_event(data)
 
     def _set_phase(self, phase: CyclePhase) -> None:
         """Update phase and emit event."""
+        if phase is self.phase:
+            return  # e.g. COORDINATING again after a cycle that failed to decide
         self.phase = phase
         self._emit_event("phase_changed", phase=phase.value)
 
@@ -161,7 +288,7 @@ class Orchestrator:
 
     async def run_cycle(self, dry_run: bool = False) -> CycleResult:
         """Run a single evolution cycle."""
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         self._emit_event("cycle_started", cycle=self.cycle)
 
@@ -185,9 +312,9 @@ class Orchestrator:
                     success=True,
                     files_modified=[],
                     tools_used={},
-                    duration_seconds=(datetime.now() - start_time).total_seconds(),
+                    duration_seconds=time.monotonic() - start_time,
                 )
-                self.cycles_history.append(result)
+                await self._record_cycle(result)
                 self._emit_event("cycle_completed", cycle=self.cycle, result=result.to_dict())
                 return result
 
@@ -202,7 +329,7 @@ class Orchestrator:
                     start_time,
                     decision,
                 )
-                self.cycles_history.append(result)
+                await self._record_cycle(result)
                 self._emit_event("cycle_failed", cycle=self.cycle, result=result.to_dict())
                 return result
 
@@ -218,11 +345,11 @@ class Orchestrator:
                 success=True,
                 files_modified=worker_result.get("files_modified", []),
                 tools_used=worker_result.get("tools_used", {}),
-                duration_seconds=(datetime.now() - start_time).total_seconds(),
+                duration_seconds=time.monotonic() - start_time,
                 commit_hash=await self._get_last_commit_hash(),
             )
 
-            self.cycles_history.append(result)
+            await self._record_cycle(result)
             self._set_phase(CyclePhase.COMPLETED)
             self._emit_event("cycle_completed", cycle=self.cycle, result=result.to_dict())
 
@@ -233,10 +360,70 @@ class Orchestrator:
 
         except Exception as e:
             result = self._make_failure_result(str(e), start_time)
-            self.cycles_history.append(result)
+            await self._record_cycle(result)
             self._emit_event("cycle_failed", cycle=self.cycle, error=str(e))
             return result
 
+    async def _record_cycle(self, result: CycleResult) -> None:
+        """Add a result to the in-memory history and the on-disk cycle record."""
+        self.cycles_history.append(result)
+        await asyncio.to_thread(self._append_cycle_record, result.to_dict())
+
+    def _append_cycle_record(self, record: dict[str, Any]) -> None:
+        """Append one cycle to the JSON-lines record."""
+        try:
+            self._cycles_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._cycles_file, "a") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError:
+            pass  # The in-memory history still has it
+
+    async def get_cycle(self, cycle_num: int) -> dict[str, Any] | None:
+        """Get a cycle's result, falling back to the on-disk record once evicted."""
+        for result in reversed(self.cycles_history):
+            if result.cycle == cycle_num:
+                return result.to_dict()
+        async with self._cycles_lock:
+            return await asyncio.to_thread(self._find_cycle_record, cycle_num)
+
+    def _find_cycle_record(self, cycle_num: int) -> dict[str, Any] | None:
+        """Find the newest recorded cycle with this number.
+
+        Record offsets are indexed as the file is read, so a lookup only parses
+        the records appended since the previous one, then reads a single line.
+        """
+        try:
+            with open(self._cycles_file, "rb") as f:
+                if os.fstat(f.fileno()).st_size < self._cycles_indexed:
+                    # Truncated or replaced; index it from the start
+                    self._cycle_offsets.clear()
+                    self._cycles_indexed = 0
+
+                offset = self._cycles_indexed
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Still being written; index it next time
+                    with contextlib.suppress(ValueError, KeyError, TypeError):
+                        self._cycle_offsets[json.loads(line)["cycle"]] = offset
+                    offset += len(line)
+                self._cycles_indexed = offset
+
+                record_offset = self._cycle_offsets.get(cycle_num)
+                if record_offset is None:
+                    return None
+                f.seek(record_offset)
+                record = json.loads(f.readline())
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(record, dict) or record.get("cycle") != cycle_num:
+            # The file was rewritten in place; rebuild the index on the next lookup
+            self._cycle_offsets.clear()
+            self._cycles_indexed = 0
+            return None
+        return record
+
     async def _run_coordinator(self, dry_run: bool) -> CoordinatorDecision | None:
         """Run the coordinator agent to decide what to do."""
         prompt = await self._build_coordinator_prompt()
@@ -251,6 +438,8 @@ class Orchestrator:
             )
 
         # Get or spawn a coordinator
+        if self._rate_limiter:
+            await self._rate_limiter.acquire()
         agent = await self.agent_manager.get_or_spawn_agent(AgentType.COORDINATOR)
         agent.current_task = "Deciding next evolution task"
 
@@ -258,10 +447,11 @@ class Orchestrator:
         await agent.start(prompt)
 
         # Wait for agent to finish
-        while agent.status == AgentStatus.RUNNING:
-            await asyncio.sleep(0.5)
+        await agent.wait_done()
 
-        if agent.status == AgentStatus.FAILED:
+        failed = agent.status == AgentStatus.FAILED
+        self._adjust_launch_rate(agent, failed)
+        if failed:
             return None
 
         # Parse decision from output
@@ -276,6 +466,8 @@ class Orchestrator:
             return {"success": True, "files_modified": [], "tools_used": {}}
 
         # Get or spawn a worker
+        if self._rate_limiter:
+            await self._rate_limiter.acquire()
         agent = await self.agent_manager.get_or_spawn_agent(AgentType.WORKER)
         agent.current_task = decision.description
 
@@ -283,198 +475,250 @@ class Orchestrator:
         await agent.start(prompt)
 
         # Wait for agent to finish
-        while agent.status == AgentStatus.RUNNING:
-            await asyncio.sleep(0.5)
+        await agent.wait_done()
 
         # Collect results
-        tools_used: dict[str, int] = {}
-        for tool in agent.tools_used:
-            tools_used[tool.tool_name] = tools_used.get(tool.tool_name, 0) + 1
+        success = agent.status != AgentStatus.FAILED and agent.error is None
+        self._adjust_launch_rate(agent, not success)
 
         return {
-            "success": agent.status != AgentStatus.FAILED and agent.error is None,
-            "files_modified": agent.files_modified,
-            "tools_used": tools_used,
+            "success": success,
+            "files_modified": list(agent.files_modified),
+            "tools_used": dict(agent.tool_counts),
             "error": agent.error,
         }
 
+    def _adjust_launch_rate(self, agent: Agent, failed: bool) -> None:
+        """Slow agent launches after a rate-limited run; speed back up after a clean one."""
+        if not self._rate_limiter:
+            return
+        if not failed:
+            self._rate_limiter.recover()
+        elif agent.error and _RATE_LIMIT_RE.search(agent.error):
+            self._rate_limiter.backoff()
+
     async def _build_coordinator_prompt(self) -> str:
         """Build the coordinator prompt."""
-        template = await self._load_prompt("coordinator")
-
-        state_content = self._read_file(self.config.get_state_file())
-        log_content = self._get_recent_log_entries(10)
-        project_content = self._read_file(self.config.get_state_dir() / "EVOLUTION_PROJECT.md")
-
-        prompt = template.replace("{{STATE}}", state_content)
-        prompt = prompt.replace("{{LOG}}", log_content)
-        prompt = prompt.replace("{{PROJECT}}", project_content)
-
-        # Inject guidance if available
-        guidance = self._read_guidance("coordinator")
-        if guidance:
-            prompt = prompt.replace("{{INJECTED_GUIDANCE}}", f"\n## Injected Guidance\n\n{guidance}\n")
-        else:
-            prompt = prompt.replace("{{INJECTED_GUIDANCE}}", "")
+        # The inputs are independent reads, so fetch them concurrently
+        template, state_content, log_content, project_content, guidance = await asyncio.gather(
+            self._load_prompt("coordinator"),
+            self._read_cached(self.config.get_state_file()),
+            asyncio.to_thread(self._get_recent_log_entries, 10),
+            self._read_cached(self._project_file),
+            self._read_guidance("coordinator"),
+        )
 
-        return prompt
+        return _render_prompt(template, {
+            "STATE": state_content,
+            "LOG": log_content,
+            "PROJECT": project_content,
+            "INJECTED_GUIDANCE": _guidance_block(guidance),
+        })
 
     async def _build_worker_prompt(self, decision: CoordinatorDecision) -> str:
         """Build the worker prompt."""
-        template = await self._load_prompt("worker")
-
-        project_content = self._read_file(self.config.get_state_dir() / "EVOLUTION_PROJECT.md")
-
-        prompt = template.replace("{{TASK_TYPE}}", decision.task_type.value)
-        prompt = prompt.replace("{{TASK_XML}}", decision.task_xml)
-        prompt = prompt.replace("{{PROJECT}}", project_content)
-
-        # Inject guidance if available
-        guidance = self._read_guidance("worker")
-        if guidance:
-            prompt = prompt.replace("{{INJECTED_GUIDANCE}}", f"\n## Injected Guidance\n\n{guidance}\n")
-        else:
-            prompt = prompt.replace("{{INJECTED_GUIDANCE}}", "")
+        template, project_content, guidance = await asyncio.gather(
+            self._load_prompt("worker"),
+            self._read_cached(self._project_file),
+            self._read_guidance("worker"),
+        )
 
-        return prompt
+        return _render_prompt(template, {
+            "TASK_TYPE": decision.task_type.value,
+            "TASK_XML": decision.task_xml,
+            "PROJECT": project_content,
+            "INJECTED_GUIDANCE": _guidance_block(guidance),
+        })
 
     async def _load_prompt(self, name: str) -> str:
         """Load a prompt template."""
         # Check for custom prompt in config
         custom_path = self.config.get_prompt_path(name)
-        if custom_path and custom_path.exists():
-            return custom_path.read_text()
+        if custom_path:
+            content = await self._read_cached(custom_path, None)
+            if content is not None:
+                return content
 
         # Fall back to default template
-        default_path = Path(__file__).parent.parent.parent / "templates" / "prompts" / f"{name}.md"
-        if default_path.exists():
-            return default_path.read_text()
+        content = await self._read_cached(_DEFAULT_PROMPTS_DIR / f"{name}.md", None)
+        if content is not None:
+            return content
 
         raise FileNotFoundError(f"Prompt template not found: {name}")
 
-    def _read_file(self, path: Path) -> str:
-        """Read file contents."""
-        if path.exists():
-            return path.read_text()
-        return ""
-
-    def _read_guidance(self, agent_type: str) -> str | None:
+    async def _read_cached(self, path: Path, default: str | None = "") -> str | None:
+        """Read a file off the event loop, reusing the last read while it is unchanged."""
+        try:
+            stat = await asyncio.to_thread(path.stat)
+        except OSError:
+            self._file_cache.pop(path, None)
+            return default
+
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._file_cache.pop(path, None)
+        if cached and cached[0] == version:
+            self._file_cache[path] = cached  # Re-insert as most recently used
+            return cached[1]
+
+        content = await asyncio.to_thread(path.read_text)
+        self._file_cache[path] = (version, content)
+        if len(self._file_cache) > _FILE_CACHE_MAX:
+            del self._file_cache[next(iter(self._file_cache))]
+        return content
+
+    async def _read_guidance(self, agent_type: str) -> str | None:
         """Read injected guidance for an agent type."""
-        guidance_dir = self.config.get_guidance_dir()
-        # Look for any guidance file matching the type
-        for f in guidance_dir.glob(f"{agent_type}*.md"):
-            content = f.read_text().strip()
-            if content:
-                return content
-        return None
+        return await asyncio.to_thread(
+            _find_guidance, self.config.get_guidance_dir(), agent_type,
+        )
 
     def _get_recent_log_entries(self, max_entries: int) -> str:
-        """Get recent log entries."""
-        log_content = self._read_file(self.config.get_log_file())
-        if not log_content:
-            return ""
-
-        cycles = re.split(r"(?=## Cycle \d+:)", log_content)
-        header = cycles[0] if cycles and not cycles[0].startswith("## Cycle") else ""
-        recent = cycles[-max_entries:] if len(cycles) > max_entries else cycles
-
-        if len(cycles) > max_entries:
-            note = f"\n\n*[Showing last {max_entries} of {len(cycles) - 1} cycles]*\n\n"
-            return header + note + "".join(recent)
-
-        return log_content
+        """Get recent log entries.
+
+        Cycle markers are indexed incrementally, so each call only scans what
+        was appended since the last one and reads the header and the tail.
+        """
+        with contextlib.ExitStack() as stack:
+            try:
+                f = stack.enter_context(open(self.config.get_log_file(), "rb"))
+            except OSError:
+                self._log_index = None
+                return ""
+
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return ""
+
+            index = self._log_index
+            if (
+                index is None
+                or index.max_entries != max_entries
+                or size < index.scanned
+                or not index.is_current(f)
+            ):
+                index = self._log_index = _LogIndex(max_entries, deque(maxlen=max_entries))
+
+            # Markers at or before the last one indexed were already counted
+            start = max(index.scanned - _LOG_RESCAN_BYTES, 0)
+            last = index.recent[-1] if index.recent else -1
+            f.seek(start)
+            appended = f.read(size - start)
+            for match in _CYCLE_MARKER_RE.finditer(appended):
+                offset = start + match.start()
+                if offset <= last:
+                    continue
+                if index.first_marker is None:
+                    index.first_marker = offset
+                index.recent.append(offset)
+                index.count += 1
+            index.scanned = size
+            index.tail = appended[-_LOG_RESCAN_BYTES:]
+
+            if index.count < max_entries:
+                f.seek(0)
+                return f.read().decode()
+
+            f.seek(0)
+            header = f.read(index.first_marker).decode()
+            f.seek(index.recent[0])
+            recent = f.read().decode()
+
+        note = f"\n\n*[Showing last {max_entries} of {index.count} cycles]*\n\n"
+        return header + note + recent
 
     def _parse_coordinator_decision(self, output: str) -> CoordinatorDecision | None:
         """Parse coordinator decision from output."""
+        # One pass finds the first marker of each type. Types keep their enum
+        # precedence (EVOLVE first), as when each pattern was searched in turn.
+        first_at: dict[TaskType, int] = {}
+        for marker in _TASK_MARKER_RE.finditer(output):
+            first_at.setdefault(TaskType(marker.group(1)), marker.start())
+            if TaskType.EVOLVE in first_at:
+                break
+
         for task_type in TaskType:
-            pattern = rf"{task_type.value}:\s*(.+?)(?=\n\n|\Z)"
-            match = re.search(pattern, output, re.DOTALL)
-            if match:
-                description = match.group(1).strip()
-
-                # Extract XML task if present
-                xml_match = re.search(r"<task>.*?</task>", output, re.DOTALL)
-                task_xml = xml_match.group(0) if xml_match else description
-
-                # Extract files
-                files_match = re.search(r"<files>(.*?)</files>", task_xml, re.DOTALL)
-                files = []
-                if files_match:
-                    files = [f.strip() for f in files_match.group(1).split("\n") if f.strip()]
-
-                # Extract skills
-                skills_match = re.search(r"<skills>(.*?)</skills>", task_xml, re.DOTALL)
-                skills = []
-                if skills_match:
-                    skills = [s.strip() for s in skills_match.group(1).split(",") if s.strip()]
-
-                return CoordinatorDecision(
-                    task_type=task_type,
-                    description=description,
-                    task_xml=task_xml,
-                    files=files,
-                    skills=skills,
-                )
+            pos = first_at.get(task_type)
+            if pos is None:
+                continue
+            match = _TASK_PATTERNS[task_type].match(output, pos)
+            if not match:
+                continue
+            description = match.group(1).strip()
+
+            # Extract XML task if present
+            xml_match = _TASK_XML_RE.search(output)
+            task_xml = xml_match.group(0) if xml_match else description
+
+            # Extract files
+            files_match = _FILES_RE.search(task_xml)
+            files = _FILE_ENTRY_RE.findall(files_match.group(1)) if files_match else []
+
+            # Extract skills
+            skills_match = _SKILLS_RE.search(task_xml)
+            skills = _SKILL_ENTRY_RE.findall(skills_match.group(1)) if skills_match else []
+
+            return CoordinatorDecision(
+                task_type=task_type,
+                description=description,
+                task_xml=task_xml,
+                files=files,
+                skills=skills,
+            )
 
         return None
 
+    async def _git(self, *args: str) -> tuple[int, str]:
+        """Run a git command in the project root; returns (returncode, stdout)."""
+        process = await asyncio.create_subprocess_exec(
+            "git", *args,
+            cwd=self.project_root,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await process.communicate()
+        return process.returncode, stdout.decode()
+
     async def _rollback(self) -> None:
         """Rollback changes on failure."""
-        import subprocess
-
         try:
-            subprocess.run(
-                ["git", "reset", "--hard", "HEAD"],
-                cwd=self.project_root,
-                capture_output=True,
-                check=False,
-            )
-            subprocess.run(
-                ["git", "clean", "-fd"],
-                cwd=self.project_root,
-                capture_output=True,
-                check=False,
-            )
+            await self._git("reset", "--hard", "HEAD")
+            await self._git("clean", "-fd")
         except Exception:
             pass
 
     async def _get_last_commit_hash(self) -> str | None:
         """Get the last commit hash."""
-        import subprocess
-
         try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout.strip()[:8]
+            returncode, stdout = await self._git("rev-parse", "HEAD")
         except Exception:
             return None
+        if returncode != 0:
+            return None
+        return stdout.strip()[:8]
 
     async def _update_state(self, result: CycleResult) -> None:
         """Update the state file after a cycle."""
         state_file = self.config.get_state_file()
-        content = self._read_file(state_file)
+        content = await self._read_cached(state_file)
 
         # Update cycle number
-        content = re.sub(r"\*\*Cycle\*\*: \d+", f"**Cycle**: {self.cycle}", content)
+        content = _STATE_CYCLE_RE.sub(f"**Cycle**: {self.cycle}", content)
 
         # Update timestamp
-        content = re.sub(
-            r"\*\*Last Updated\*\*: .*",
+        content = _STATE_UPDATED_RE.sub(
             f"**Last Updated**: {datetime.now().isoformat()}",
             content,
         )
 
-        state_file.write_text(content)
+        await asyncio.to_thread(state_file.write_text, content)
+        # Drop the cached copy: on coarse-mtime filesystems a same-size rewrite
+        # would otherwise still match the old (mtime, size) version
+        self._file_cache.pop(state_file, None)
 
     def _make_failure_result(
         self,
         error: str,
-        start_time: datetime,
+        start_time: float,
         decision: CoordinatorDecision | None = None,
     ) -> CycleResult:
         """Create a failure result."""
@@ -485,7 +729,7 @@ class Orchestrator:
             success=False,
             files_modified=[],
             tools_used={},
-            duration_seconds=(datetime.now() - start_time).total_seconds(),
+            duration_seconds=time.monotonic() - start_time,
             error=error,
         )
 
@@ -503,10 +747,12 @@ class Orchestrator:
 
     def get_status(self) -> dict[str, Any]:
         """Get orchestrator status."""
+        recent = list(islice(reversed(self.cycles_history), 10))
+        recent.reverse()
         return {
             "running": self.running,
             "cycle": self.cycle,
             "phase": self.phase.value,
             "agentPool": self.agent_manager.get_status(),
-            "recentCycles": [r.to_dict() for r in self.cycles_history[-10:]],
+            "recentCycles": [r.to_dict() for r in recent],
         }
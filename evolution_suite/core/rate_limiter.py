@@ -0,0 +1,50 @@
+"""Token bucket admission control for agent runs."""
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Token bucket whose refill rate adapts AIMD-style.
+
+    Tokens refill continuously at ``rate`` per second, up to ``burst``.
+    ``backoff`` halves the rate after a rate-limited run and ``recover``
+    adds back a quarter of the configured rate after a clean one.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._min_rate = rate / 16
+        self._step = rate / 4
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until ``tokens`` are available, then take them."""
+        # Waiters queue on the lock, so they are admitted in arrival order
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+    def backoff(self) -> None:
+        """Halve the refill rate (multiplicative decrease)."""
+        self._refill()
+        self.rate = max(self.rate / 2, self._min_rate)
+
+    def recover(self) -> None:
+        """Step the refill rate back toward its configured value (additive increase)."""
+        if self.rate < self.max_rate:
+            self._refill()
+            self.rate = min(self.rate + self._step, self.max_rate)
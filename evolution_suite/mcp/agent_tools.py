@@ -10,20 +10,153 @@ from __future__ import annotations
 
 import asyncio
 import os
+import random
+import time
+from collections import deque
 from typing import Any
 
 import httpx
+import orjson
+import websockets
 from mcp.server import Server
 from mcp.types import Tool, TextContent
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Default API URL - can be overridden via environment variable
 API_BASE_URL = os.environ.get("EVOLUTION_SUITE_API_URL", "http://localhost:8000/api")
 
+# wait_for_agent polling (used without the event socket): delay grows from min to max
+POLL_DELAY_MIN = 0.2
+POLL_DELAY_MAX = 2.0
+POLL_BACKOFF = 1.7
+
+# Marker shown before each agent in list_agents, by status
+_STATUS_EMOJI = {
+    "idle": "⚪",
+    "running": "🟢",
+    "paused": "🟡",
+    "stopped": "⚫",
+    "failed": "🔴",
+}
+
+# Only request what list_agents and get_agent_output display, already shortened
+_LIST_AGENTS_PARAMS = {"fields": "id,type,status,goal,currentTask", "truncate": 100}
+_OUTPUT_PARAMS = {"fields": "type,content", "truncate": 200}
+
+# Recent output requested with each wait_for_agent poll, shown once the agent finishes
+_FINAL_OUTPUT_PARAMS = {"recent_output": 5, "truncate": 100}
+
+# Prefix shown before each output line in get_agent_output, by line type
+_LINE_PREFIX = {
+    "text": "",
+    "thinking": "[thinking] ",
+    "tool_use": "[tool] ",
+    "result": "[result] ",
+    "error": "[ERROR] ",
+}
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# HTTP clients by base URL, shared by every server created in this process
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _get_client(base_url: str) -> httpx.AsyncClient:
+    """Get the shared keep-alive client for an API base URL."""
+    client = _clients.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            # Retries connection failures only; requests are never re-sent
+            transport=httpx.AsyncHTTPTransport(retries=1),
+        )
+        _clients[base_url] = client
+    return client
+
+
+async def _post_json(client: httpx.AsyncClient, path: str, body: Any) -> httpx.Response:
+    """POST a body encoded with orjson."""
+    return await client.post(path, content=orjson.dumps(body), headers=_JSON_HEADERS)
+
+
+# GETs in flight by (API base URL, path, query); identical concurrent reads share one request
+_inflight: dict[tuple[Any, ...], asyncio.Task[httpx.Response]] = {}
+
+
+async def _get(
+    client: httpx.AsyncClient,
+    path: str,
+    params: dict[str, Any] | None = None,
+) -> httpx.Response:
+    """GET ``path``, joining an identical request that is already in flight."""
+    key = (str(client.base_url), path, tuple(sorted(params.items())) if params else ())
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(client.get(path, params=params))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one caller being cancelled doesn't fail the others
+    return await asyncio.shield(task)
+
+
+# Recent agent records by (API base URL, agent ID), with the monotonic time they were read
+_agent_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+AGENT_CACHE_TTL = 0.5  # Seconds a record is reused by get_agent_status
+
+
+def _cache_agent(client: httpx.AsyncClient, agent: dict[str, Any]) -> None:
+    """Remember a freshly read agent record."""
+    now = time.monotonic()
+    if len(_agent_cache) >= 256:
+        for key, (read_at, _) in list(_agent_cache.items()):
+            if now - read_at >= AGENT_CACHE_TTL:
+                del _agent_cache[key]
+    _agent_cache[(str(client.base_url), agent["id"])] = (now, agent)
+
+
+async def _get_agent_cached(client: httpx.AsyncClient, agent_id: str) -> dict[str, Any] | None:
+    """Get an agent record, reusing one read within the last AGENT_CACHE_TTL seconds."""
+    key = (str(client.base_url), agent_id)
+    cached = _agent_cache.get(key)
+    if cached and time.monotonic() - cached[0] < AGENT_CACHE_TTL:
+        return cached[1]
+
+    response = await _get(client, f"/agents/{agent_id}")
+    if response.status_code == 404:
+        _agent_cache.pop(key, None)
+        return None
+
+    response.raise_for_status()
+    agent = orjson.loads(response.content)
+    _cache_agent(client, agent)
+    return agent
+
+
+# Last output window per (API base URL, agent ID), with the cursor to resume from;
+# least recently used first, trimmed to OUTPUT_TAILS_MAX as agents come and go
+_output_tails: dict[tuple[str, str], tuple[int, deque[dict[str, Any]]]] = {}
+OUTPUT_TAILS_MAX = 64
+
+
+async def close_clients() -> None:
+    """Close the shared HTTP clients."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+
 
 class SpawnWorkerArgs(BaseModel):
     """Arguments for spawn_worker tool."""
+    model_config = ConfigDict(frozen=True)
+
     task_description: str
     files_to_modify: list[str] | None = None
     acceptance_criteria: str | None = None
@@ -31,44 +164,90 @@ class SpawnWorkerArgs(BaseModel):
 
 class SpawnEvaluatorArgs(BaseModel):
     """Arguments for spawn_evaluator tool."""
+    model_config = ConfigDict(frozen=True)
+
     review_scope: str
     files_to_review: list[str] | None = None
     criteria: str | None = None
 
 
+class SpawnAgentsArgs(BaseModel):
+    """Arguments for spawn_agents tool."""
+    model_config = ConfigDict(frozen=True)
+
+    workers: list[SpawnWorkerArgs] = Field(default_factory=list)
+    evaluators: list[SpawnEvaluatorArgs] = Field(default_factory=list)
+
+
 class GetAgentStatusArgs(BaseModel):
     """Arguments for get_agent_status tool."""
+    model_config = ConfigDict(frozen=True)
+
     agent_id: str
 
 
 class GetAgentOutputArgs(BaseModel):
     """Arguments for get_agent_output tool."""
+    model_config = ConfigDict(frozen=True)
+
     agent_id: str
     limit: int = 50
 
 
 class WaitForAgentArgs(BaseModel):
     """Arguments for wait_for_agent tool."""
+    model_config = ConfigDict(frozen=True)
+
     agent_id: str
     timeout_seconds: int = 300
 
 
-def create_mcp_server(api_base_url: str | None = None) -> Server:
-    """Create an MCP server with agent management tools."""
-
-    base_url = api_base_url or API_BASE_URL
-    server = Server("evolution-suite-agents")
-
-    # HTTP client for API calls
-    client = httpx.AsyncClient(base_url=base_url, timeout=60.0)
-
-    @server.list_tools()
-    async def list_tools() -> list[Tool]:
-        """List available tools."""
-        return [
-            Tool(
-                name="spawn_worker",
-                description="""Spawn a new WORKER agent to implement code changes.
+# Input schemas shared by the single and bulk spawn tools
+_SPAWN_WORKER_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "task_description": {
+            "type": "string",
+            "description": "Clear description of what the worker should implement or fix"
+        },
+        "files_to_modify": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of files the worker should focus on (optional)"
+        },
+        "acceptance_criteria": {
+            "type": "string",
+            "description": "What success looks like for this task (optional)"
+        }
+    },
+    "required": ["task_description"]
+}
+
+_SPAWN_EVALUATOR_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "review_scope": {
+            "type": "string",
+            "description": "What the evaluator should review"
+        },
+        "files_to_review": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of files to review (optional)"
+        },
+        "criteria": {
+            "type": "string",
+            "description": "Specific criteria to evaluate against (optional)"
+        }
+    },
+    "required": ["review_scope"]
+}
+
+# Tool definitions, built once; list_tools hands out the same list every time
+_TOOLS: list[Tool] = [
+    Tool(
+        name="spawn_worker",
+        description="""Spawn a new WORKER agent to implement code changes.
 
 Workers are execution agents that:
 - Write code and implement features
@@ -77,29 +256,11 @@ Workers are execution agents that:
 - Make changes to files
 
 Use this when you need code to be written or modified.""",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "task_description": {
-                            "type": "string",
-                            "description": "Clear description of what the worker should implement or fix"
-                        },
-                        "files_to_modify": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of files the worker should focus on (optional)"
-                        },
-                        "acceptance_criteria": {
-                            "type": "string",
-                            "description": "What success looks like for this task (optional)"
-                        }
-                    },
-                    "required": ["task_description"]
-                }
-            ),
-            Tool(
-                name="spawn_evaluator",
-                description="""Spawn a new EVALUATOR agent to review code changes.
+        inputSchema=_SPAWN_WORKER_SCHEMA
+    ),
+    Tool(
+        name="spawn_evaluator",
+        description="""Spawn a new EVALUATOR agent to review code changes.
 
 Evaluators are review agents that:
 - Review code for bugs and issues
@@ -108,127 +269,227 @@ Evaluators are review agents that:
 - Suggest improvements
 
 Use this after workers complete their tasks to validate the changes.""",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "review_scope": {
-                            "type": "string",
-                            "description": "What the evaluator should review"
-                        },
-                        "files_to_review": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of files to review (optional)"
-                        },
-                        "criteria": {
-                            "type": "string",
-                            "description": "Specific criteria to evaluate against (optional)"
-                        }
-                    },
-                    "required": ["review_scope"]
+        inputSchema=_SPAWN_EVALUATOR_SCHEMA
+    ),
+    Tool(
+        name="spawn_agents",
+        description="""Spawn several WORKER and/or EVALUATOR agents in one step.
+
+Takes the same fields as spawn_worker and spawn_evaluator, as lists.
+All agents are created and started together, so prefer this over repeated
+single spawns when delegating several independent tasks at once.""",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workers": {
+                    "type": "array",
+                    "items": _SPAWN_WORKER_SCHEMA,
+                    "description": "Worker tasks to start (optional)"
+                },
+                "evaluators": {
+                    "type": "array",
+                    "items": _SPAWN_EVALUATOR_SCHEMA,
+                    "description": "Evaluator reviews to start (optional)"
                 }
-            ),
-            Tool(
-                name="list_agents",
-                description="""List all current agents and their status.
+            }
+        }
+    ),
+    Tool(
+        name="list_agents",
+        description="""List all current agents and their status.
 
 Returns information about all spawned agents including:
 - Agent ID and type (coordinator/worker/evaluator)
 - Current status (idle/running/paused/stopped/failed)
 - Current task or goal
 - Output statistics""",
-                inputSchema={
-                    "type": "object",
-                    "properties": {}
-                }
-            ),
-            Tool(
-                name="get_agent_status",
-                description="""Get detailed status of a specific agent.
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="get_agent_status",
+        description="""Get detailed status of a specific agent.
 
 Returns the agent's current state, task, and recent activity.""",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "agent_id": {
-                            "type": "string",
-                            "description": "The ID of the agent to check"
-                        }
-                    },
-                    "required": ["agent_id"]
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "agent_id": {
+                    "type": "string",
+                    "description": "The ID of the agent to check"
                 }
-            ),
-            Tool(
-                name="get_agent_output",
-                description="""Get recent output from an agent.
+            },
+            "required": ["agent_id"]
+        }
+    ),
+    Tool(
+        name="get_agent_output",
+        description="""Get recent output from an agent.
 
 Useful for checking what an agent has been doing and whether it encountered issues.""",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "agent_id": {
-                            "type": "string",
-                            "description": "The ID of the agent"
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Number of recent output lines to return (default 50)",
-                            "default": 50
-                        }
-                    },
-                    "required": ["agent_id"]
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "agent_id": {
+                    "type": "string",
+                    "description": "The ID of the agent"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Number of recent output lines to return (default 50)",
+                    "default": 50
                 }
-            ),
-            Tool(
-                name="wait_for_agent",
-                description="""Wait for an agent to complete its task.
+            },
+            "required": ["agent_id"]
+        }
+    ),
+    Tool(
+        name="wait_for_agent",
+        description="""Wait for an agent to complete its task.
 
 Blocks until the agent reaches a terminal state (stopped/failed) or timeout.
 Use this when you need to wait for a worker to finish before spawning evaluators.""",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "agent_id": {
-                            "type": "string",
-                            "description": "The ID of the agent to wait for"
-                        },
-                        "timeout_seconds": {
-                            "type": "integer",
-                            "description": "Maximum time to wait (default 300 seconds)",
-                            "default": 300
-                        }
-                    },
-                    "required": ["agent_id"]
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "agent_id": {
+                    "type": "string",
+                    "description": "The ID of the agent to wait for"
+                },
+                "timeout_seconds": {
+                    "type": "integer",
+                    "description": "Maximum time to wait (default 300 seconds)",
+                    "default": 300
                 }
-            ),
-        ]
+            },
+            "required": ["agent_id"]
+        }
+    ),
+]
+
+
+class AgentEventBus:
+    """Shares one dashboard WebSocket between concurrent wait_for_agent calls.
+
+    The socket is opened on the first subscription and closed when the last
+    subscriber leaves. Each subscriber queue receives the agent's new status
+    values, "removed" if the agent is killed, or None if the socket drops.
+    """
+
+    def __init__(self, ws_url: str):
+        self.ws_url = ws_url
+        self._subscribers: dict[str, list[asyncio.Queue[str | None]]] = {}
+        self._reader: asyncio.Task[None] | None = None
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self, agent_id: str) -> asyncio.Queue[str | None] | None:
+        """Subscribe to an agent's status changes, or None if the socket is unavailable."""
+        async with self._lock:
+            if self._reader is None or self._reader.done():
+                try:
+                    ws = await websockets.connect(self.ws_url, max_size=None)
+                except (OSError, websockets.WebSocketException):
+                    return None
+                self._reader = asyncio.create_task(self._read(ws))
+
+            queue: asyncio.Queue[str | None] = asyncio.Queue()
+            self._subscribers.setdefault(agent_id, []).append(queue)
+            return queue
+
+    def unsubscribe(self, agent_id: str, queue: asyncio.Queue[str | None]) -> None:
+        """Drop a subscription, closing the socket once nobody is listening."""
+        queues = self._subscribers.get(agent_id)
+        if queues and queue in queues:
+            queues.remove(queue)
+            if not queues:
+                del self._subscribers[agent_id]
+        if not self._subscribers and self._reader:
+            self._reader.cancel()
+            self._reader = None
+
+    async def _read(self, ws: Any) -> None:
+        """Route agent_status/agent_killed events to the subscribed queues."""
+        try:
+            async for message in ws:
+                # Most traffic is agent output; skip it without parsing
+                if '"agent_status"' not in message and '"agent_killed"' not in message:
+                    continue
+                event = orjson.loads(message)
+                queues = self._subscribers.get(event.get("agentId"))
+                if not queues:
+                    continue
+                event_type = event.get("type")
+                if event_type == "agent_status":
+                    update = event.get("status")
+                elif event_type == "agent_killed":
+                    update = "removed"
+                else:
+                    continue
+                for queue in queues:
+                    queue.put_nowait(update)
+        except (OSError, ValueError, websockets.WebSocketException):
+            pass
+        finally:
+            for queues in self._subscribers.values():
+                for queue in queues:
+                    queue.put_nowait(None)
+            await ws.close()
+
+
+def _ws_url(api_base_url: str) -> str:
+    """Dashboard WebSocket URL for an API base URL (``.../api`` -> ``.../ws``)."""
+    url = httpx.URL(api_base_url)
+    path = url.path.rstrip("/").removesuffix("/api")
+    return str(url.copy_with(scheme="wss" if url.scheme == "https" else "ws", path=f"{path}/ws"))
+
+
+def create_mcp_server(api_base_url: str | None = None) -> Server:
+    """Create an MCP server with agent management tools."""
+
+    base_url = api_base_url or API_BASE_URL
+    server = Server("evolution-suite-agents")
+
+    # HTTP client for API calls
+    client = _get_client(base_url)
+    events = AgentEventBus(_ws_url(base_url))
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        """List available tools."""
+        return _TOOLS
 
     @server.call_tool()
     async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle tool calls."""
         try:
             if name == "spawn_worker":
-                args = SpawnWorkerArgs(**arguments)
+                args = SpawnWorkerArgs.model_validate(arguments)
                 return await _spawn_worker(client, args)
 
             elif name == "spawn_evaluator":
-                args = SpawnEvaluatorArgs(**arguments)
+                args = SpawnEvaluatorArgs.model_validate(arguments)
                 return await _spawn_evaluator(client, args)
 
+            elif name == "spawn_agents":
+                args = SpawnAgentsArgs.model_validate(arguments)
+                return await _spawn_agents(client, args)
+
             elif name == "list_agents":
                 return await _list_agents(client)
 
             elif name == "get_agent_status":
-                args = GetAgentStatusArgs(**arguments)
+                args = GetAgentStatusArgs.model_validate(arguments)
                 return await _get_agent_status(client, args)
 
             elif name == "get_agent_output":
-                args = GetAgentOutputArgs(**arguments)
+                args = GetAgentOutputArgs.model_validate(arguments)
                 return await _get_agent_output(client, args)
 
             elif name == "wait_for_agent":
-                args = WaitForAgentArgs(**arguments)
-                return await _wait_for_agent(client, args)
+                args = WaitForAgentArgs.model_validate(arguments)
+                return await _wait_for_agent(client, events, args)
 
             else:
                 return [TextContent(type="text", text=f"Unknown tool: {name}")]
@@ -240,15 +501,8 @@ Use this when you need to wait for a worker to finish before spawning evaluators
     return server
 
 
-async def _spawn_worker(client: httpx.AsyncClient, args: SpawnWorkerArgs) -> list[TextContent]:
-    """Spawn a worker agent via HTTP API."""
-    # Spawn the agent
-    response = await client.post("/agents", json={"type": "worker"})
-    response.raise_for_status()
-    agent = response.json()
-    agent_id = agent["id"]
-
-    # Build the prompt
+def _worker_prompt(args: SpawnWorkerArgs) -> str:
+    """Build the prompt for a worker task."""
     prompt_parts = [
         f"WORKER TASK: {args.task_description}",
     ]
@@ -261,11 +515,16 @@ async def _spawn_worker(client: httpx.AsyncClient, args: SpawnWorkerArgs) -> lis
 
     prompt_parts.append("\n\nComplete this task thoroughly. When done, summarize what you accomplished.")
 
-    prompt = "\n".join(prompt_parts)
+    return "\n".join(prompt_parts)
 
-    # Start the agent
-    response = await client.post(f"/agents/{agent_id}/start", json={"content": prompt})
+
+async def _spawn_worker(client: httpx.AsyncClient, args: SpawnWorkerArgs) -> list[TextContent]:
+    """Spawn a worker agent via HTTP API."""
+    # Spawn and start the agent in one request
+    prompt = _worker_prompt(args)
+    response = await _post_json(client, "/agents", {"type": "worker", "prompt": prompt})
     response.raise_for_status()
+    agent_id = orjson.loads(response.content)["id"]
 
     return [TextContent(
         type="text",
@@ -273,15 +532,22 @@ async def _spawn_worker(client: httpx.AsyncClient, args: SpawnWorkerArgs) -> lis
     )]
 
 
-async def _spawn_evaluator(client: httpx.AsyncClient, args: SpawnEvaluatorArgs) -> list[TextContent]:
-    """Spawn an evaluator agent via HTTP API."""
-    # Spawn the agent
-    response = await client.post("/agents", json={"type": "evaluator"})
-    response.raise_for_status()
-    agent = response.json()
-    agent_id = agent["id"]
+# Checklist closing every evaluator prompt
+_EVAL_SUFFIX = """
+
+
+Your evaluation should check:
+1. Code correctness - Does it work as intended?
+2. Code quality - Is it clean, readable, maintainable?
+3. Test coverage - Are there adequate tests?
+4. Edge cases - Are edge cases handled?
+5. Security - Any potential security issues?
+
+Provide a clear summary of findings with specific issues and recommendations."""
+
 
-    # Build the prompt
+def _evaluator_prompt(args: SpawnEvaluatorArgs) -> str:
+    """Build the prompt for an evaluator review."""
     prompt_parts = [
         f"EVALUATOR TASK: Review and evaluate the following:\n{args.review_scope}",
     ]
@@ -292,22 +558,16 @@ async def _spawn_evaluator(client: httpx.AsyncClient, args: SpawnEvaluatorArgs)
     if args.criteria:
         prompt_parts.append(f"\nEvaluation criteria: {args.criteria}")
 
-    prompt_parts.append("""
-
-Your evaluation should check:
-1. Code correctness - Does it work as intended?
-2. Code quality - Is it clean, readable, maintainable?
-3. Test coverage - Are there adequate tests?
-4. Edge cases - Are edge cases handled?
-5. Security - Any potential security issues?
-
-Provide a clear summary of findings with specific issues and recommendations.""")
+    return "\n".join(prompt_parts) + _EVAL_SUFFIX
 
-    prompt = "\n".join(prompt_parts)
 
-    # Start the agent
-    response = await client.post(f"/agents/{agent_id}/start", json={"content": prompt})
+async def _spawn_evaluator(client: httpx.AsyncClient, args: SpawnEvaluatorArgs) -> list[TextContent]:
+    """Spawn an evaluator agent via HTTP API."""
+    # Spawn and start the agent in one request
+    prompt = _evaluator_prompt(args)
+    response = await _post_json(client, "/agents", {"type": "evaluator", "prompt": prompt})
     response.raise_for_status()
+    agent_id = orjson.loads(response.content)["id"]
 
     return [TextContent(
         type="text",
@@ -315,53 +575,72 @@ Provide a clear summary of findings with specific issues and recommendations."""
     )]
 
 
+async def _spawn_agents(client: httpx.AsyncClient, args: SpawnAgentsArgs) -> list[TextContent]:
+    """Spawn several workers and evaluators in one HTTP API request."""
+    requests = [
+        {"type": "worker", "prompt": _worker_prompt(worker)} for worker in args.workers
+    ] + [
+        {"type": "evaluator", "prompt": _evaluator_prompt(evaluator)}
+        for evaluator in args.evaluators
+    ]
+    if not requests:
+        return [TextContent(type="text", text="No agents to spawn.")]
+
+    response = await _post_json(client, "/agents/bulk", {"agents": requests})
+    response.raise_for_status()
+    agents = iter(orjson.loads(response.content))
+
+    lines = [f"Spawned and started {len(requests)} agents:\n"]
+    for i, worker in enumerate(args.workers, 1):
+        lines.append(f"Worker {i}: {next(agents)['id']}")
+        lines.append(f"   Task: {worker.task_description}")
+    for i, evaluator in enumerate(args.evaluators, 1):
+        lines.append(f"Evaluator {i}: {next(agents)['id']}")
+        lines.append(f"   Review scope: {evaluator.review_scope}")
+
+    return [TextContent(type="text", text="\n".join(lines))]
+
+
 async def _list_agents(client: httpx.AsyncClient) -> list[TextContent]:
     """List all agents via HTTP API."""
-    response = await client.get("/agents")
+    response = await _get(client, "/agents", params=_LIST_AGENTS_PARAMS)
     response.raise_for_status()
-    agents = response.json()
+    agents = orjson.loads(response.content)
 
     if not agents:
         return [TextContent(type="text", text="No agents currently spawned.")]
 
-    lines = ["Current agents:\n"]
+    blocks = []
 
     for agent in agents:
         status = agent.get("status", "unknown")
-        status_emoji = {
-            "idle": "⚪",
-            "running": "🟢",
-            "paused": "🟡",
-            "stopped": "⚫",
-            "failed": "🔴",
-        }.get(status, "❓")
+        status_emoji = _STATUS_EMOJI.get(status, "❓")
 
         agent_type = agent.get("type", "unknown")
         agent_id = agent.get("id", "unknown")
         goal = agent.get("goal")
         current_task = agent.get("currentTask")
 
-        lines.append(f"{status_emoji} [{agent_type.upper()}] {agent_id}")
-        lines.append(f"   Status: {status}")
+        lines = [
+            f"{status_emoji} [{agent_type.upper()}] {agent_id}",
+            f"   Status: {status}",
+        ]
         if goal:
-            lines.append(f"   Goal: {goal[:100]}...")
+            lines.append(f"   Goal: {goal}")
         if current_task:
-            lines.append(f"   Task: {current_task[:100]}...")
-        lines.append("")
+            lines.append(f"   Task: {current_task}")
+        blocks.append("\n".join(lines))
 
-    return [TextContent(type="text", text="\n".join(lines))]
+    text = "Current agents:\n\n" + "\n\n".join(blocks)
+    return [TextContent(type="text", text=text)]
 
 
 async def _get_agent_status(client: httpx.AsyncClient, args: GetAgentStatusArgs) -> list[TextContent]:
     """Get status of a specific agent via HTTP API."""
-    response = await client.get(f"/agents/{args.agent_id}")
-
-    if response.status_code == 404:
+    agent = await _get_agent_cached(client, args.agent_id)
+    if agent is None:
         return [TextContent(type="text", text=f"Agent not found: {args.agent_id}")]
 
-    response.raise_for_status()
-    agent = response.json()
-
     lines = [
         f"Agent: {agent.get('id')}",
         f"Type: {agent.get('type')}",
@@ -384,48 +663,74 @@ async def _get_agent_status(client: httpx.AsyncClient, args: GetAgentStatusArgs)
 
 async def _get_agent_output(client: httpx.AsyncClient, args: GetAgentOutputArgs) -> list[TextContent]:
     """Get recent output from an agent via HTTP API."""
-    response = await client.get(f"/agents/{args.agent_id}/output", params={"limit": args.limit})
+    # Only fetch lines added since the last call and roll them into the kept window
+    key = (str(client.base_url), args.agent_id)
+    since, output = _output_tails.pop(key, (0, None))
+    if output is None or output.maxlen != args.limit:
+        since, output = 0, deque(maxlen=args.limit)
+
+    response = await _get(
+        client,
+        f"/agents/{args.agent_id}/output",
+        params={"since": since, "limit": args.limit, **_OUTPUT_PARAMS},
+    )
 
     if response.status_code == 404:
         return [TextContent(type="text", text=f"Agent not found: {args.agent_id}")]
 
     response.raise_for_status()
-    data = response.json()
-    output = data.get("lines", [])
+    data = orjson.loads(response.content)
+    output.extend(data.get("lines", []))
+    _output_tails[key] = (data.get("nextSeq", 0), output)  # Re-insert as most recently used
+    if len(_output_tails) > OUTPUT_TAILS_MAX:
+        del _output_tails[next(iter(_output_tails))]
 
     if not output:
         return [TextContent(type="text", text=f"No output from agent {args.agent_id}")]
 
-    lines = [f"Recent output from {args.agent_id}:\n"]
-
-    for line in output:
-        line_type = line.get("type", "text")
-        prefix = {
-            "text": "",
-            "thinking": "[thinking] ",
-            "tool_use": "[tool] ",
-            "result": "[result] ",
-            "error": "[ERROR] ",
-        }.get(line_type, "")
+    body = "\n".join([
+        _LINE_PREFIX.get(line.get("type", "text"), "") + line.get("content", "")
+        for line in output
+    ])
+    return [TextContent(type="text", text=f"Recent output from {args.agent_id}:\n\n{body}")]
 
-        content = line.get("content", "")
-        content = content[:200] + "..." if len(content) > 200 else content
-        lines.append(f"{prefix}{content}")
 
-    return [TextContent(type="text", text="\n".join(lines))]
-
-
-async def _wait_for_agent(client: httpx.AsyncClient, args: WaitForAgentArgs) -> list[TextContent]:
+async def _wait_for_agent(
+    client: httpx.AsyncClient,
+    events: AgentEventBus,
+    args: WaitForAgentArgs,
+) -> list[TextContent]:
     """Wait for an agent to complete via HTTP API."""
+    # Subscribe before taking the snapshot so no transition falls between them
+    updates = await events.subscribe(args.agent_id)
+    try:
+        return await _await_terminal_status(client, events, updates, args)
+    finally:
+        if updates is not None:
+            events.unsubscribe(args.agent_id, updates)
+
+
+async def _await_terminal_status(
+    client: httpx.AsyncClient,
+    events: AgentEventBus,
+    updates: asyncio.Queue[str | None] | None,
+    args: WaitForAgentArgs,
+) -> list[TextContent]:
+    """Follow an agent's status until it is terminal.
+
+    Status changes come from the event bus; without one (or once its socket
+    drops) this falls back to polling the API.
+    """
     terminal_states = {"stopped", "failed", "idle"}
 
-    # Get initial status
-    response = await client.get(f"/agents/{args.agent_id}")
+    # Get initial status; always read fresh, a cached record may predate the subscription
+    response = await _get(client, f"/agents/{args.agent_id}")
     if response.status_code == 404:
         return [TextContent(type="text", text=f"Agent not found: {args.agent_id}")]
 
     response.raise_for_status()
-    agent = response.json()
+    agent = orjson.loads(response.content)
+    _cache_agent(client, agent)
     status = agent.get("status")
 
     if status in terminal_states:
@@ -434,36 +739,66 @@ async def _wait_for_agent(client: httpx.AsyncClient, args: WaitForAgentArgs) ->
             text=f"Agent {args.agent_id} already in terminal state: {status}"
         )]
 
-    # Poll for completion
-    elapsed = 0
-    poll_interval = 2  # seconds
-
-    while elapsed < args.timeout_seconds:
-        await asyncio.sleep(poll_interval)
-        elapsed += poll_interval
-
-        response = await client.get(f"/agents/{args.agent_id}")
-        if response.status_code == 404:
-            return [TextContent(type="text", text=f"Agent {args.agent_id} was removed")]
-
-        response.raise_for_status()
-        agent = response.json()
-        status = agent.get("status")
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + args.timeout_seconds
+    delay = POLL_DELAY_MIN
+
+    while (remaining := deadline - loop.time()) > 0:
+        if updates is not None:
+            try:
+                update = await asyncio.wait_for(updates.get(), remaining)
+            except TimeoutError:
+                break
+            if update is None:
+                # Socket dropped; poll from here on, and leave the bus so a
+                # later reconnect doesn't keep filling this queue
+                events.unsubscribe(args.agent_id, updates)
+                updates = None
+                continue
+            # The cached record no longer matches what the agent is doing
+            _agent_cache.pop((str(client.base_url), args.agent_id), None)
+            if update == "removed":
+                return [TextContent(type="text", text=f"Agent {args.agent_id} was removed")]
+            status = update
+            final_output = None
+        else:
+            # Jitter keeps concurrent waits from polling in lockstep
+            await asyncio.sleep(min(delay * random.uniform(0.9, 1.1), remaining))
+
+            # Carry the final output along, so the last poll needs no second request
+            response = await _get(client, f"/agents/{args.agent_id}", params=_FINAL_OUTPUT_PARAMS)
+            if response.status_code == 404:
+                return [TextContent(type="text", text=f"Agent {args.agent_id} was removed")]
+
+            response.raise_for_status()
+            agent = orjson.loads(response.content)
+            _cache_agent(client, agent)
+            final_output = agent.get("recentOutput")
+
+            # Sample an agent that is changing state closely; back off while it is steady
+            previous, status = status, agent.get("status")
+            if status != previous:
+                delay = POLL_DELAY_MIN
+            else:
+                delay = min(delay * POLL_BACKOFF, POLL_DELAY_MAX)
 
         if status in terminal_states:
-            # Get final output
-            output_response = await client.get(
-                f"/agents/{args.agent_id}/output",
-                params={"limit": 10}
-            )
+            # Get final output, unless the poll that saw the status brought it
+            if final_output is None:
+                final_output = []
+                output_response = await _get(
+                    client,
+                    f"/agents/{args.agent_id}/output",
+                    params={"since": 0, "limit": 5, "fields": "content", "truncate": 100}
+                )
+                if output_response.status_code == 200:
+                    output_data = orjson.loads(output_response.content)
+                    final_output = output_data.get("lines", [])
             output_summary = ""
-            if output_response.status_code == 200:
-                output_data = output_response.json()
-                output_lines = output_data.get("lines", [])[-5:]
-                if output_lines:
-                    output_summary = "\n\nFinal output:\n" + "\n".join(
-                        line.get("content", "")[:100] for line in output_lines
-                    )
+            if final_output:
+                output_summary = "\n\nFinal output:\n" + "\n".join(
+                    line.get("content", "") for line in final_output
+                )
 
             return [TextContent(
                 type="text",
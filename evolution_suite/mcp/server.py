@@ -16,19 +16,22 @@ import sys
 
 from mcp.server.stdio import stdio_server
 
-from evolution_suite.mcp.agent_tools import create_mcp_server
+from evolution_suite.mcp.agent_tools import close_clients, create_mcp_server
 
 
 async def main():
     """Run the MCP server."""
     server = create_mcp_server()
 
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    finally:
+        await close_clients()
 
 
 if __name__ == "__main__":
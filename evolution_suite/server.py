@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import mimetypes
 import webbrowser
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -10,8 +11,12 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import Response
+from starlette.types import Scope
 
 from evolution_suite.api.routes import create_router
 from evolution_suite.browser import PLAYWRIGHT_AVAILABLE
@@ -23,6 +28,60 @@ from evolution_suite.comms.websocket import WebSocketManager
 from evolution_suite.core.config import Config, load_config
 from evolution_suite.core.orchestrator import Orchestrator
 
+# Copies written next to each built asset by the frontend build, in order of preference
+_PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _encoding_weights(accept_encoding: str) -> dict[str, float]:
+    """Parse an Accept-Encoding header into {coding: q}."""
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding] = q
+    return weights
+
+
+class AssetFiles(StaticFiles):
+    """Static files for the frontend build's content-hashed assets.
+
+    A changed asset gets a new name, so responses may be cached for good.
+    The .br/.gz copies are sent instead when the client accepts them.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        weights = _encoding_weights(Headers(scope=scope).get("accept-encoding", ""))
+        response = None
+        for encoding, suffix in _PRECOMPRESSED:
+            # q=0 refuses a coding; "*" covers any coding not listed
+            if weights.get(encoding, weights.get("*", 0.0)) <= 0:
+                continue
+            try:
+                response = await super().get_response(path + suffix, scope)
+            except HTTPException:
+                continue
+            response.headers["content-encoding"] = encoding
+            response.headers["content-type"] = (
+                mimetypes.guess_type(path)[0] or "application/octet-stream"
+            )
+            break
+
+        if response is None:
+            response = await super().get_response(path, scope)
+        response.headers["cache-control"] = "public, max-age=31536000, immutable"
+        response.headers["vary"] = "Accept-Encoding"
+        return response
+
 
 def create_app(config: Config, project_root: Path) -> FastAPI:
     """Create the FastAPI application."""
@@ -83,6 +142,7 @@ def create_app(config: Config, project_root: Path) -> FastAPI:
         description="RTS-style command center for autonomous AI agent pools",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # CORS for development
@@ -112,11 +172,14 @@ def create_app(config: Config, project_root: Path) -> FastAPI:
     # Static files (frontend)
     static_dir = Path(__file__).parent / "static"
     if static_dir.exists():
-        app.mount("/assets", StaticFiles(directory=static_dir / "assets"), name="assets")
+        app.mount("/assets", AssetFiles(directory=static_dir / "assets"), name="assets")
+
+        # index.html names the current asset hashes, so always revalidate it
+        index_headers = {"cache-control": "no-cache"}
 
         @app.get("/")
         async def serve_index():
-            return FileResponse(static_dir / "index.html")
+            return FileResponse(static_dir / "index.html", headers=index_headers)
 
         @app.get("/{path:path}")
         async def serve_spa(path: str):
@@ -125,7 +188,7 @@ def create_app(config: Config, project_root: Path) -> FastAPI:
             if file_path.exists() and file_path.is_file():
                 return FileResponse(file_path)
             # Fall back to index.html for SPA routing
-            return FileResponse(static_dir / "index.html")
+            return FileResponse(static_dir / "index.html", headers=index_headers)
     else:
         @app.get("/")
         async def no_frontend():
@@ -152,20 +215,46 @@ async def run_server(
 
     app = create_app(config, project_root)
 
-    # Open browser after short delay
-    if open_browser:
-        async def open_browser_delayed():
-            await asyncio.sleep(1.5)
-            webbrowser.open(f"http://{host}:{port}")
-
-        asyncio.create_task(open_browser_delayed())
+    # Parse HTTP with httptools' C parser where it is installed (uvicorn[standard]).
+    # The event loop is the caller's (uvloop via cli.run_async), and the server
+    # stays a single process: agents and websocket connections live in memory.
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
 
     # Run server
     server_config = uvicorn.Config(
         app,
         host=host,
         port=port,
+        http=http,
         log_level="info",
     )
-    server = uvicorn.Server(server_config)
-    await server.serve()
+    # The lifespan startup hook runs before uvicorn binds its socket, so
+    # signal readiness from Server.startup() instead, once it has bound
+    listening = asyncio.Event()
+
+    class Server(uvicorn.Server):
+        async def startup(self, sockets=None) -> None:
+            await super().startup(sockets=sockets)
+            if self.started:
+                listening.set()
+
+    server = Server(server_config)
+
+    # Open browser once the server is listening
+    browser_task = None
+    if open_browser:
+        async def open_browser_when_listening():
+            await listening.wait()
+            await asyncio.to_thread(webbrowser.open, f"http://{host}:{port}")
+
+        browser_task = asyncio.create_task(open_browser_when_listening())
+
+    try:
+        await server.serve()
+    finally:
+        if browser_task:
+            browser_task.cancel()
@@ -39,16 +39,16 @@ export function useInitialData() {
 }
 
 export function useAgentOutput(agentId: string | null) {
-  const { outputBuffers, addOutputLine } = useAgentStore();
+  const { outputBuffers, addOutputLines } = useAgentStore();
 
   useEffect(() => {
     if (!agentId) return;
 
     // Fetch initial output for selected agent
     api.getAgentOutput(agentId, 500, 0).then(({ lines }) => {
-      lines.forEach((line) => addOutputLine(agentId, line));
+      addOutputLines(agentId, lines);
     }).catch(console.error);
-  }, [agentId, addOutputLine]);
+  }, [agentId, addOutputLines]);
 
   return outputBuffers[agentId ?? '']?.lines ?? [];
 }
@@ -96,9 +96,11 @@ export type WebSocketEventType =
   | 'connected'
   | 'agent_spawned'
   | 'agent_output'
+  | 'agent_output_batch'
   | 'agent_tool_use'
   | 'agent_status'
   | 'agent_killed'
+  | 'agent_error'
   | 'cycle_started'
   | 'cycle_completed'
   | 'cycle_failed'
@@ -27,6 +27,7 @@ interface AgentStore {
   // Agent output buffers
   outputBuffers: Record<string, AgentOutputBuffer>;
   addOutputLine: (agentId: string, line: OutputLine) => void;
+  addOutputLines: (agentId: string, lines: OutputLine[]) => void;
   clearOutput: (agentId: string) => void;
 
   // Selected agent for output view
@@ -82,10 +83,11 @@ export const useAgentStore = create<AgentStore>((set, get) => ({
 
   // Agent output buffers
   outputBuffers: {},
-  addOutputLine: (agentId, line) =>
+  addOutputLine: (agentId, line) => get().addOutputLines(agentId, [line]),
+  addOutputLines: (agentId, lines) =>
     set((state) => {
       const buffer = state.outputBuffers[agentId] || { lines: [], maxLines: MAX_OUTPUT_LINES };
-      const newLines = [...buffer.lines, line];
+      const newLines = [...buffer.lines, ...lines];
       // Trim if over max
       if (newLines.length > buffer.maxLines) {
         newLines.splice(0, newLines.length - buffer.maxLines);
@@ -159,6 +161,12 @@ export const useAgentStore = create<AgentStore>((set, get) => ({
         }
         break;
 
+      case 'agent_output_batch':
+        if (event.agentId && Array.isArray(event.lines)) {
+          state.addOutputLines(event.agentId as string, event.lines as OutputLine[]);
+        }
+        break;
+
       case 'agent_status':
         if (event.agentId && event.status) {
           state.updateAgentStatus(event.agentId as string, event.status as Agent['status']);
@@ -1,9 +1,31 @@
-import { defineConfig } from 'vite'
+import { defineConfig, type Plugin } from 'vite'
 import react from '@vitejs/plugin-react'
+import fs from 'fs'
 import path from 'path'
+import zlib from 'zlib'
+
+// Write .br and .gz copies of the built JS/CSS for the server to send precompressed
+function precompress(): Plugin {
+  return {
+    name: 'precompress',
+    apply: 'build',
+    writeBundle(options, bundle) {
+      for (const fileName of Object.keys(bundle)) {
+        if (!/^assets\/.*\.(js|css|svg)$/.test(fileName)) continue
+        const file = path.join(options.dir!, fileName)
+        const data = fs.readFileSync(file)
+        if (data.length < 1024) continue
+        fs.writeFileSync(`${file}.br`, zlib.brotliCompressSync(data, {
+          params: { [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY },
+        }))
+        fs.writeFileSync(`${file}.gz`, zlib.gzipSync(data, { level: 9 }))
+      }
+    },
+  }
+}
 
 export default defineConfig({
-  plugins: [react()],
+  plugins: [react(), precompress()],
   resolve: {
     alias: {
       '@': path.resolve(__dirname, './src'),
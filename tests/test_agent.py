@@ -0,0 +1,89 @@
+"""Tests for the Agent subprocess wrapper."""
+
+import asyncio
+import time
+from collections import deque
+
+import pytest
+
+from evolution_suite.core import agent as agent_module
+from evolution_suite.core.agent import Agent, AgentStatus, AgentType, OutputLine
+from evolution_suite.core.config import get_default_config
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = get_default_config("test")
+    config.project_root = tmp_path
+    return config
+
+
+def _run_shell(monkeypatch, script: str) -> None:
+    """Make Agent.start() run ``script`` instead of the claude CLI."""
+    monkeypatch.setattr(agent_module, "_CMD_PREFIX", ("sh", "-c", script, "sh"))
+
+
+async def test_exit_detected_while_grandchild_holds_stdout(monkeypatch, config):
+    # The background sleep inherits stdout, so the pipe stays open after sh exits
+    _run_shell(monkeypatch, "echo hello; sleep 1.5 2>/dev/null & exit 3")
+    monkeypatch.setattr(agent_module, "EXIT_DRAIN_SECONDS", 0.1)
+    agent = Agent(AgentType.WORKER, config)
+
+    started = time.monotonic()
+    await asyncio.wait_for(agent.start("prompt"), timeout=5)
+
+    assert time.monotonic() - started < 0.8
+    assert agent.process.returncode == 3
+    assert agent.status == AgentStatus.STOPPED
+    assert any(
+        line.content == "[debug] Process exited with code 3" for line in agent.output_buffer
+    )
+    # Let the grandchild release the pipe so the transport closes with the loop alive
+    await asyncio.wait_for(agent.process.stdout.read(), timeout=5)
+    await asyncio.sleep(0)
+
+
+async def test_exit_event_set_per_run(monkeypatch, config):
+    _run_shell(monkeypatch, "exit 0")
+    agent = Agent(AgentType.WORKER, config)
+
+    await agent.start("first")
+    first_exited = agent._process_exited
+    assert first_exited.is_set()
+
+    await agent.start("second")
+    assert agent._process_exited is not first_exited
+    assert agent._process_exited.is_set()
+    assert agent.process.returncode == 0
+
+
+def _add_lines(agent: Agent, *contents: str) -> None:
+    for content in contents:
+        agent._add_output(OutputLine(content=content, line_type="text"))
+
+
+def test_output_since_cursor_returns_new_lines(config):
+    agent = Agent(AgentType.WORKER, config)
+    _add_lines(agent, "a", "b")
+    cursor = agent.output_seq
+    _add_lines(agent, "c", "d", "e")
+
+    assert [line.content for line in agent.get_output_since(cursor)] == ["c", "d", "e"]
+    assert [line.content for line in agent.get_output_since(cursor, limit=2)] == ["d", "e"]
+    assert agent.get_output_since(agent.output_seq) == []
+
+
+def test_output_since_skips_lines_evicted_from_buffer(config):
+    agent = Agent(AgentType.WORKER, config)
+    agent.output_buffer = deque(maxlen=3)
+    agent.set_callbacks()  # Rebind the output helpers to the smaller buffer
+    _add_lines(agent, "a", "b", "c", "d", "e")
+
+    assert [line.content for line in agent.get_output_since(1)] == ["c", "d", "e"]
+
+
+def test_output_since_resets_cursor_from_a_previous_agent(config):
+    agent = Agent(AgentType.WORKER, config)
+    _add_lines(agent, "a")
+
+    assert [line.content for line in agent.get_output_since(50)] == ["a"]
@@ -0,0 +1,68 @@
+"""Tests for the agent pool manager."""
+
+from datetime import date, timedelta
+
+import pytest
+from starlette.testclient import TestClient
+
+from evolution_suite.core.agent import AgentType
+from evolution_suite.core.agent_manager import AgentManager, DailyUsage, DuplicateAgentError
+from evolution_suite.core.config import get_default_config
+from evolution_suite.server import create_app
+
+
+@pytest.fixture
+def manager(tmp_path):
+    config = get_default_config("test")
+    config.project_root = tmp_path
+    return AgentManager(config)
+
+
+def test_finished_day_is_archived_and_still_reported(manager):
+    yesterday = date.today() - timedelta(days=1)
+    daily = DailyUsage(date=yesterday, cycles=2, successful_cycles=1)
+    daily.metrics.input_tokens = 10
+    daily.by_model["opus"].output_tokens = 5
+    manager.daily_usage[yesterday] = daily
+    # As if the manager was last asked for the date yesterday
+    manager._today = yesterday
+    manager._today_ends_at = 0.0
+
+    manager.get_today_usage()
+
+    assert yesterday not in manager.daily_usage
+    assert (manager.config.get_usage_dir() / f"{yesterday.isoformat()}.json").exists()
+
+    today_usage, archived, never_recorded = manager.get_usage_history(3)
+    assert today_usage.date == date.today()
+    assert archived.date == yesterday
+    assert archived.metrics.input_tokens == 10
+    assert archived.by_model["opus"].output_tokens == 5
+    assert archived.to_dict()["successRate"] == 50
+    assert never_recorded.date == yesterday - timedelta(days=1)
+    assert never_recorded.metrics.input_tokens == 0
+
+
+async def test_spawn_rejects_an_id_in_use(manager):
+    agent = await manager.spawn_agent(AgentType.WORKER, agent_id="w1")
+
+    with pytest.raises(DuplicateAgentError):
+        await manager.spawn_agent(AgentType.EVALUATOR, agent_id="w1")
+    assert manager.agents["w1"] is agent
+    assert await manager.list_agents(AgentType.EVALUATOR) == []
+
+
+def test_spawn_routes_answer_409_for_ids_in_use(tmp_path):
+    config = get_default_config("test")
+    config.project_root = tmp_path
+    client = TestClient(create_app(config, tmp_path))
+
+    assert client.post("/api/agents", json={"type": "worker", "agentId": "w1"}).status_code == 200
+    assert client.post("/api/agents", json={"type": "worker", "agentId": "w1"}).status_code == 409
+
+    bulk = [{"type": "worker", "agentId": "w2"}, {"type": "worker", "agentId": "w1"}]
+    assert client.post("/api/agents/bulk", json={"agents": bulk}).status_code == 409
+    repeated = [{"type": "worker", "agentId": "w3"}, {"type": "worker", "agentId": "w3"}]
+    assert client.post("/api/agents/bulk", json={"agents": repeated}).status_code == 409
+    # Neither batch spawned any of its agents
+    assert [a["id"] for a in client.get("/api/agents").json()] == ["w1"]
@@ -0,0 +1,125 @@
+"""Tests for the orchestrator's cycle record and evolution log reads."""
+
+import json
+
+import pytest
+
+from evolution_suite.core.config import get_default_config
+from evolution_suite.core.orchestrator import Orchestrator
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    config = get_default_config("test")
+    config.project_root = tmp_path
+    return Orchestrator(config, tmp_path)
+
+
+def _write_records(orchestrator: Orchestrator, *cycles: int, mode: str = "a") -> None:
+    orchestrator._cycles_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(orchestrator._cycles_file, mode) as f:
+        for cycle in cycles:
+            f.write(json.dumps({"cycle": cycle, "description": f"cycle {cycle}"}) + "\n")
+
+
+async def test_cycle_lookup_without_record_file(orchestrator):
+    assert await orchestrator.get_cycle(1) is None
+
+
+async def test_cycle_index_extends_with_appended_records(orchestrator):
+    _write_records(orchestrator, 1, 2)
+    assert (await orchestrator.get_cycle(2))["description"] == "cycle 2"
+    indexed = orchestrator._cycles_indexed
+
+    _write_records(orchestrator, 3)
+    assert (await orchestrator.get_cycle(3))["cycle"] == 3
+    assert orchestrator._cycles_indexed > indexed
+    assert (await orchestrator.get_cycle(1))["cycle"] == 1
+
+
+async def test_newest_record_for_a_cycle_wins(orchestrator):
+    _write_records(orchestrator, 1)
+    with open(orchestrator._cycles_file, "a") as f:
+        f.write(json.dumps({"cycle": 1, "description": "rerun"}) + "\n")
+
+    assert (await orchestrator.get_cycle(1))["description"] == "rerun"
+
+
+async def test_partial_and_malformed_lines_are_skipped(orchestrator):
+    _write_records(orchestrator, 1)
+    with open(orchestrator._cycles_file, "a") as f:
+        f.write("not json\n")
+        f.write('{"cycle": 2')
+
+    assert await orchestrator.get_cycle(2) is None
+
+    with open(orchestrator._cycles_file, "a") as f:
+        f.write(', "description": "late"}\n')
+    assert (await orchestrator.get_cycle(2))["description"] == "late"
+
+
+async def test_truncated_record_file_is_reindexed(orchestrator):
+    _write_records(orchestrator, 1, 2, 3)
+    assert await orchestrator.get_cycle(3) is not None
+
+    _write_records(orchestrator, 7, mode="w")
+    assert await orchestrator.get_cycle(3) is None
+    assert (await orchestrator.get_cycle(7))["cycle"] == 7
+
+
+async def test_rewritten_record_file_is_reindexed(orchestrator):
+    _write_records(orchestrator, 1, 2)
+    assert await orchestrator.get_cycle(2) is not None
+
+    # Same length, different cycles: the stale offset no longer matches
+    _write_records(orchestrator, 5, 6, mode="w")
+    assert await orchestrator.get_cycle(2) is None
+    assert (await orchestrator.get_cycle(6))["cycle"] == 6
+
+
+def _write_log(orchestrator: Orchestrator, text: str, mode: str = "a") -> None:
+    log_file = orchestrator.config.get_log_file()
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_file, mode) as f:
+        f.write(text)
+
+
+def _cycles(*numbers: int) -> str:
+    return "".join(f"## Cycle {n}: change {n}\n\nDetails.\n\n" for n in numbers)
+
+
+def test_recent_log_entries_without_log(orchestrator):
+    assert orchestrator._get_recent_log_entries(3) == ""
+
+
+def test_short_log_is_returned_whole(orchestrator):
+    text = "# Evolution Log\n\n" + _cycles(1, 2)
+    _write_log(orchestrator, text)
+
+    assert orchestrator._get_recent_log_entries(3) == text
+
+
+def test_long_log_keeps_header_and_newest_cycles(orchestrator):
+    _write_log(orchestrator, "# Evolution Log\n\n" + _cycles(1, 2, 3, 4))
+    orchestrator._get_recent_log_entries(2)
+    _write_log(orchestrator, _cycles(5))
+
+    entries = orchestrator._get_recent_log_entries(2)
+
+    assert entries.startswith("# Evolution Log\n\n")
+    assert "*[Showing last 2 of 5 cycles]*" in entries
+    assert "## Cycle 4:" in entries and "## Cycle 5:" in entries
+    assert "## Cycle 3:" not in entries
+
+
+def test_rewritten_log_is_reindexed(orchestrator):
+    _write_log(orchestrator, "# Evolution Log\n\n" + _cycles(1, 2, 3, 4))
+    orchestrator._get_recent_log_entries(2)
+
+    # Longer than before, so only the content check can notice the rewrite
+    _write_log(orchestrator, "# Rewritten log header\n\n" + _cycles(7, 8, 9), mode="w")
+    entries = orchestrator._get_recent_log_entries(2)
+
+    assert entries.startswith("# Rewritten log header\n\n")
+    assert "*[Showing last 2 of 3 cycles]*" in entries
+    assert "## Cycle 9:" in entries and "## Cycle 7:" not in entries
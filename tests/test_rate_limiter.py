@@ -0,0 +1,58 @@
+"""Tests for agent launch admission control."""
+
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from evolution_suite.core.config import AgentsConfig
+from evolution_suite.core.rate_limiter import RateLimiter
+
+
+async def test_burst_is_admitted_immediately():
+    limiter = RateLimiter(rate=1.0, burst=3)
+
+    started = time.monotonic()
+    for _ in range(3):
+        await limiter.acquire()
+
+    assert time.monotonic() - started < 0.1
+
+
+async def test_acquire_waits_for_refill_once_burst_is_spent():
+    limiter = RateLimiter(rate=20.0, burst=1)
+    await limiter.acquire()
+
+    started = time.monotonic()
+    await limiter.acquire()
+
+    assert time.monotonic() - started >= 0.04
+
+
+def test_backoff_halves_rate_down_to_floor():
+    limiter = RateLimiter(rate=16.0, burst=1)
+    limiter.backoff()
+    assert limiter.rate == 8.0
+
+    for _ in range(10):
+        limiter.backoff()
+    assert limiter.rate == 1.0
+
+
+def test_recover_steps_back_to_configured_rate():
+    limiter = RateLimiter(rate=16.0, burst=1)
+    limiter.backoff()
+    limiter.backoff()
+    assert limiter.rate == 4.0
+
+    limiter.recover()
+    assert limiter.rate == 8.0
+    for _ in range(10):
+        limiter.recover()
+    assert limiter.rate == 16.0
+
+
+@pytest.mark.parametrize("burst", [0, -1])
+def test_launch_burst_below_one_is_rejected(burst):
+    with pytest.raises(ValidationError):
+        AgentsConfig(launch_burst=burst)
@@ -0,0 +1,141 @@
+"""Tests for the dashboard server."""
+
+import asyncio
+import gzip
+import mimetypes
+import socket
+
+import pytest
+import uvicorn
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from evolution_suite import server as server_module
+from evolution_suite.server import AssetFiles, _encoding_weights, run_server
+
+SOURCE = b"console.log('hello');\n" * 8
+
+
+@pytest.fixture
+def client(tmp_path):
+    (tmp_path / "app.js").write_bytes(SOURCE)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(SOURCE))
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+    (tmp_path / "plain.css").write_bytes(b"body {}")
+    app = Starlette(routes=[Mount("/assets", AssetFiles(directory=tmp_path))])
+    return TestClient(app)
+
+
+def test_encoding_weights_parses_q_values():
+    assert _encoding_weights("gzip, br;q=0.5, *;q=0, x;q=bad") == {
+        "gzip": 1.0,
+        "br": 0.5,
+        "*": 0.0,
+        "x": 0.0,
+    }
+    assert _encoding_weights("") == {}
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip, br", "br"),
+        ("gzip, br;q=0", "gzip"),
+        ("BR;Q=0, GZIP", "gzip"),
+        ("*", "br"),
+        ("*;q=0, gzip", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("identity", None),
+    ],
+)
+def test_precompressed_copy_follows_accept_encoding(client, accept_encoding, expected):
+    response = client.get("/assets/app.js", headers={"accept-encoding": accept_encoding})
+
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == expected
+    assert response.headers["content-type"].startswith(mimetypes.guess_type("app.js")[0])
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "immutable" in response.headers["cache-control"]
+    if expected != "br":
+        assert response.content == SOURCE
+
+
+def test_asset_without_precompressed_copy_is_served_as_is(client):
+    response = client.get("/assets/plain.css", headers={"accept-encoding": "gzip, br"})
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.content == b"body {}"
+
+
+def test_missing_asset_is_404(client):
+    response = client.get("/assets/missing.js", headers={"accept-encoding": "gzip"})
+
+    assert response.status_code == 404
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "evolution.yaml").write_text("project:\n  name: test\n")
+    return tmp_path
+
+
+@pytest.fixture
+async def opened(monkeypatch):
+    """URLs passed to webbrowser.open, with an event set on the first one."""
+    loop = asyncio.get_running_loop()
+    urls: list[str] = []
+    event = asyncio.Event()
+
+    def fake_open(url):
+        urls.append(url)
+        loop.call_soon_threadsafe(event.set)
+
+    monkeypatch.setattr(server_module.webbrowser, "open", fake_open)
+    return urls, event
+
+
+@pytest.fixture
+def servers(monkeypatch):
+    """uvicorn.Server instances started by run_server."""
+    started = []
+    original = uvicorn.Server.startup
+
+    async def startup(self, sockets=None):
+        started.append(self)
+        await original(self, sockets=sockets)
+
+    monkeypatch.setattr(uvicorn.Server, "startup", startup)
+    return started
+
+
+async def test_browser_opens_once_server_is_listening(project, opened, servers):
+    urls, event = opened
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    task = asyncio.create_task(run_server(project, port=port))
+
+    await asyncio.wait_for(event.wait(), timeout=10)
+    assert servers[0].started
+    assert urls == [f"http://127.0.0.1:{port}"]
+
+    servers[0].should_exit = True
+    await asyncio.wait_for(task, timeout=10)
+
+
+async def test_browser_not_opened_when_server_fails_to_bind(project, opened, servers):
+    urls, _ = opened
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        port = sock.getsockname()[1]
+
+        with pytest.raises(SystemExit):
+            await run_server(project, port=port)
+
+    await asyncio.sleep(0)
+    assert urls == []
+    # The browser task was cancelled rather than left waiting
+    assert asyncio.all_tasks() == {asyncio.current_task()}
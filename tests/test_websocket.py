@@ -0,0 +1,129 @@
+"""Tests for the WebSocket send queues."""
+
+import asyncio
+import json
+
+from evolution_suite.comms import websocket as ws_module
+from evolution_suite.comms.websocket import (
+    CONTROL_QUEUE_SIZE,
+    SEND_QUEUE_SIZE,
+    WebSocketManager,
+    _Outbox,
+)
+
+
+async def _drain(outbox: _Outbox) -> list[str]:
+    return [await outbox.get() for _ in range(len(outbox))]
+
+
+class FakeWebSocket:
+    """Records sent frames; send_text blocks while ``stalled`` is set."""
+
+    def __init__(self):
+        self.sent: list[dict] = []
+        self.closed_with: int | None = None
+        self.unstalled = asyncio.Event()
+        self.unstalled.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        await self.unstalled.wait()
+        self.sent.append(json.loads(text))
+
+    async def close(self, code: int = 1000):
+        self.closed_with = code
+
+
+async def test_droppable_messages_keep_newest():
+    outbox = _Outbox()
+    for i in range(SEND_QUEUE_SIZE + 10):
+        outbox.put_droppable(str(i))
+
+    assert len(outbox) == SEND_QUEUE_SIZE
+    assert (await _drain(outbox))[0] == "10"
+
+
+async def test_control_and_droppable_interleave_in_order():
+    outbox = _Outbox()
+    outbox.put_droppable("a")
+    outbox.put("b")
+    outbox.put_droppable("c")
+    outbox.put("d")
+
+    assert await _drain(outbox) == ["a", "b", "c", "d"]
+
+
+async def test_status_keeps_latest_and_usage_sums():
+    outbox = _Outbox()
+    status = ("agent_status", "w1")
+    usage = ("usage_update", "w1")
+    for state in ("starting", "running", "completed"):
+        message = {"type": "agent_status", "agentId": "w1", "status": state}
+        outbox.put_state(status, message, json.dumps(message))
+    for tokens in (1, 2, 3):
+        message = {"type": "usage_update", "agentId": "w1", "metrics": {"inputTokens": tokens}}
+        outbox.put_state(usage, message, json.dumps(message))
+
+    sent = [json.loads(text) for text in await _drain(outbox)]
+    assert [m["type"] for m in sent] == ["agent_status", "usage_update"]
+    assert sent[0]["status"] == "completed"
+    assert sent[1]["metrics"] == {"inputTokens": 6}
+
+    # Once delivered, the next event for the agent is queued afresh
+    message = {"type": "agent_status", "agentId": "w1", "status": "idle"}
+    outbox.put_state(status, message, json.dumps(message))
+    assert len(outbox) == 1
+
+
+async def test_control_queue_overflow_is_reported():
+    outbox = _Outbox()
+    for i in range(CONTROL_QUEUE_SIZE):
+        assert outbox.put(str(i))
+
+    assert not outbox.put("one too many")
+    assert outbox.overflowed
+
+
+async def test_publish_skips_unserializable_message():
+    manager = WebSocketManager()
+    websocket = FakeWebSocket()
+    await manager.connect(websocket)
+
+    manager.publish({"type": "phase_changed", "value": object()})
+    manager.publish({"type": "phase_changed", "value": 1})
+    await asyncio.sleep(0)
+
+    assert [m["type"] for m in websocket.sent] == ["connected", "phase_changed"]
+    await manager.disconnect(websocket)
+
+
+async def test_stalled_client_is_closed_once_control_queue_overflows(monkeypatch):
+    monkeypatch.setattr(ws_module, "CONTROL_QUEUE_SIZE", 4)
+    manager = WebSocketManager()
+    stalled = FakeWebSocket()
+    healthy = FakeWebSocket()
+    await manager.connect(stalled)
+    await manager.connect(healthy)
+    await asyncio.sleep(0)
+    stalled.unstalled.clear()
+
+    # Output and per-agent state never overflow the queue
+    for i in range(50):
+        manager.publish({"type": "agent_output", "agentId": "w1", "line": i})
+        manager.publish({"type": "agent_tool_use", "agentId": "w1", "tool": i})
+        manager.publish({"type": "agent_status", "agentId": "w1", "status": str(i)})
+    assert stalled in manager.connections
+
+    for i in range(5):
+        manager.publish({"type": "cycle_started", "cycle": i})
+        await asyncio.sleep(0.01)  # The healthy client keeps up
+
+    assert stalled not in manager.connections
+    assert stalled.closed_with == 1013
+    assert healthy in manager.connections
+    assert healthy.closed_with is None
+    assert len([m for m in healthy.sent if m["type"] == "cycle_started"]) == 5
+    await manager.disconnect(healthy)
+